@@ -2,1056 +2,1905 @@
 # -*- coding: utf-8 -*-
 
 import os
-import textwrap
-import datetime
-import argparse
+import sys
+import time
+import collections
 import click
 
-class FireUp:
+__version__ = '1.0'
 
-    def __init__(
-        self,
-        target_dir,
-        project_name,
-        author,
-        email
-        ):
-
-        format_code = lambda x: textwrap.dedent(x).strip()
-
-        project_name = project_name.replace(' ', '_').replace('-', '_')
-        project_name_str = ''.join(list(map(lambda x: x.capitalize(), f'{project_name}'.split('_'))))
-        project_env = f'.venv-{project_name.replace("_","-")}'
-
-        today = str(datetime.datetime.now().date()).replace('-','')
-
-        requirements = [
-            'pipreqs',
-            'ipykernel',
-            'mkdocs',
-            'mkdocs-material',
-            'mkdocstrings',
-            'python-dotenv',
-            'loguru',
-            'click',
-            'pytest',
-            'pytest-html',
-            'pydantic',
-            'hydra-core',
-            'boto3',
-            'streamlit',
-            'pylint',
-            'mypy'
-            ]
-        requirements = format_code('\n'.join(requirements))
-
-        streamlit_app = format_code(
-            f'''
-            #!/usr/bin/env python3
-            # -*- coding: utf-8 -*-
-            # pylint: disable=E1120
-
-            import streamlit as st
-            import os
-            from {project_name} import serve_config
-
-            config = serve_config()
-
-            def main(config : dict = config) -> None:
-
-                st.sidebar.markdown("# {project_name_str} - dashboard")
-                st.write("# Hello from {project_name_str}!")
-                st.write("_built with FireUp!_")
-                st.write(config)
-                st.write(os.environ.get('LOGURU_LEVEL'))
-
-            if __name__ == "__main__":
-                main()
-            '''
-            )
-
-        jupyter_notebook = format_code(
-            f'''
-            {{
-            "cells": [
-            {{
-            "cell_type": "code",
-            "metadata": {{
-            }},
-            "outputs": [],
-            "source": [
-                "# sample notebook\\n"
-            ]
-            }}
-            ],
-            "metadata": {{
-            }},
-            "nbformat": 4,
-            "nbformat_minor": 2
-            }}
-            '''
-            )
-
-        readme = format_code(
-            f'''
-            # {project_name_str}
-
-            {project_name_str} is a Python package initialized with FireUp!
-
-            ## Installation
-
-            Use the package manager [pip](https://pip.pypa.io/en/stable/) to install {project_name} in edit mode.
-
-            ```python
-            >>> pip install -e . # in the root folder (look for setup.py)
-            ```
-
-            ## Project tree structure
-
-            ```python
-            root/
-            │
-            ├── {project_env}/
-            │
-            ├── cdk-app/
-            |
-            ├── config/
-            │
-            ├── dashboard/
-            |   |
-            │   ├── assets/
-            |   |
-            │   ├── components/
-            |   |
-            │   ├── app.py
-            |   |
-            │   └── utils.py
-            │
-            ├── data/
-            │
-            ├── docker/
-            |   |
-            │   └── dashboard/
-            |       |
-            │       └── Dockerfile
-            |
-            ├── docs/
-            |   |
-            │   ├── css/
-            │   |   └── mkdocstrings.css
-            |   |
-            │   └── index.md
-            |
-            ├── notebooks/
-            │
-            ├── tests/
-            |
-            ├── {project_name}/
-            |   |
-            |   ├── __init__.py
-            │   │
-            |   ├── core/
-            │   |   └── __init__.py
-            │   │
-            |   └── utils/
-            │       └── __init__.py
-            |
-            ├── .dockerignore
-            ├── .env
-            ├── .gitignore
-            ├── config.mk
-            ├── docker-compoe.yml
-            ├── Makefile
-            ├── mkdocs.yml
-            ├── README.md
-            ├── requirements.txt
-            └── setup.py
-            ```
-
-            ## Usage
-
-            Install [streamlit](https://docs.streamlit.io/) via `pip` and execute the following in the root folder to run Streamlit sample app (by default on port 8501)
-
-            ```python
-            >>> cd ./dashboard
-            >>> streamlit run app.py
-            ```
-
-            ## Authors
-
-            - **{author}**
-            '''
-            )
-
-        setup = format_code(
-            f'''
-            """A setuptools based setup module.
-            See:
-            https://packaging.python.org/guides/distributing-packages-using-setuptools/
-            https://github.com/pypa/sampleproject
-            """
-
-            # Always prefer setuptools over distutils
-            from setuptools import setup, find_packages # type: ignore
-            from os import path
-
-            with open('requirements.txt') as f:
-                requirements = f.read().splitlines()
-
-            # Arguments marked as "Required" below must be included for upload to PyPI.
-            # Fields marked as "Optional" may be commented out.
-
-            setup(
-                # This is the name of your project. The first time you publish this
-                # package, this name will be registered for you. It will determine how
-                # users can install this project, e.g.:
-                #
-                # $ pip install sampleproject
-                #
-                # And where it will live on PyPI: https://pypi.org/project/sampleproject/
-                #
-                # There are some restrictions on what makes a valid project name
-                # specification here:
-                # https://packaging.python.org/specifications/core-metadata/#name
-                name='{project_name}',  # Required
-
-                # Versions should comply with PEP 440:
-                # https://www.python.org/dev/peps/pep-0440/
-                #
-                # For a discussion on single-sourcing the version across setup.py and the
-                # project code, see
-                # https://packaging.python.org/en/latest/single_source_version.html
-                version='1.0.0',  # Required
-
-                # This is a one-line description or tagline of what your project does. This
-                # corresponds to the "Summary" metadata field:
-                # https://packaging.python.org/specifications/core-metadata/#summary
-                description='{project_name_str}',  # Optional
-
-                # This should be your name or the name of the organization which owns the
-                # project.
-                author='{author}',  # Optional
-
-                # This should be a valid email address corresponding to the author listed
-                # above.
-                author_email='{email}',  # Optional
-
-                # This field adds keywords for your project which will appear on the
-                # project page. What does your project relate to?
-                #
-                # Note that this is a string of words separated by whitespace, not a list.
-                keywords='sample setuptools development',  # Optional
-
-                # When your source code is in a subdirectory under the project root, e.g.
-                # `src/`, it is necessary to specify the `package_dir` argument.
-                # package_dir={{'': '{project_name}'}},  # Optional
-
-                # You can just specify package directories manually here if your project is
-                # simple. Or you can use find_packages().
-                #
-                # Alternatively, if you just want to distribute a single Python file, use
-                # the `py_modules` argument instead as follows, which will expect a file
-                # called `my_module.py` to exist:
-                #
-                #   py_modules=["my_module"],
-                #
-                packages=find_packages(exclude=['data', 'docs', '{project_env}', 'notebooks']),  # Required
-
-                # Specify which Python versions you support. In contrast to the
-                # 'Programming Language' classifiers above, 'pip install' will check this
-                # and refuse to install the project if the version does not match. If you
-                # do not support Python 2, you can simplify this to '>=3.5' or similar, see
-                # https://packaging.python.org/guides/distributing-packages-using-setuptools/#python-requires
-                python_requires='>=3.6',
-
-                # This field lists other packages that your project depends on to run.
-                # Any package you put here will be installed by pip when your project is
-                # installed, so they must be valid existing projects.
-                #
-                # For an analysis of "install_requires" vs pip's requirements files see:
-                # https://packaging.python.org/en/latest/requirements.html
-                install_requires=requirements,  # Optional
-            )
-            '''
-            )
-
-        gitignore = format_code(
-            f'''
-
-            # Created by https://www.gitignore.io/api/osx,linux,python,windows,pycharm,visualstudiocode
-
-            ### Linux ###
-            *~
-
-            # temporary files which can be created if a process still has a handle open of a deleted file
-            .fuse_hidden*
-
-            # KDE directory preferences
-            .directory
-
-            # Linux trash folder which might appear on any partition or disk
-            .Trash-*
-
-            # .nfs files are created when an open file is removed but is still being accessed
-            .nfs*
-
-            ### OSX ###
-            *.DS_Store
-            .AppleDouble
-            .LSOverride
-
-            # Icon must end with two \r
-            Icon
-
-            # Thumbnails
-            ._*
-
-            # Files that might appear in the root of a volume
-            .DocumentRevisions-V100
-            .fseventsd
-            .Spotlight-V100
-            .TemporaryItems
-            .Trashes
-            .VolumeIcon.icns
-            .com.apple.timemachine.donotpresent
-
-            # Directories potentially created on remote AFP share
-            .AppleDB
-            .AppleDesktop
-            Network Trash Folder
-            Temporary Items
-            .apdisk
-
-            ### PyCharm ###
-            # Covers JetBrains IDEs: IntelliJ, RubyMine, PhpStorm, AppCode, PyCharm, CLion, Android Studio and Webstorm
-            # Reference: https://intellij-support.jetbrains.com/hc/en-us/articles/206544839
-
-            # User-specific stuff:
-            .idea/**/workspace.xml
-            .idea/**/tasks.xml
-            .idea/dictionaries
-
-            # Sensitive or high-churn files:
-            .idea/**/dataSources/
-            .idea/**/dataSources.ids
-            .idea/**/dataSources.xml
-            .idea/**/dataSources.local.xml
-            .idea/**/sqlDataSources.xml
-            .idea/**/dynamic.xml
-            .idea/**/uiDesigner.xml
-
-            # Gradle:
-            .idea/**/gradle.xml
-            .idea/**/libraries
-
-            # CMake
-            cmake-build-debug/
-
-            # Mongo Explorer plugin:
-            .idea/**/mongoSettings.xml
-
-            ## File-based project format:
-            *.iws
-
-            ## Plugin-specific files:
-
-            # IntelliJ
-            /out/
-
-            # mpeltonen/sbt-idea plugin
-            .idea_modules/
-
-            # JIRA plugin
-            atlassian-ide-plugin.xml
-
-            # Cursive Clojure plugin
-            .idea/replstate.xml
-
-            # Ruby plugin and RubyMine
-            /.rakeTasks
-
-            # Crashlytics plugin (for Android Studio and IntelliJ)
-            com_crashlytics_export_strings.xml
-            crashlytics.properties
-            crashlytics-build.properties
-            fabric.properties
-
-            ### PyCharm Patch ###
-            # Comment Reason: https://github.com/joeblau/gitignore.io/issues/186#issuecomment-215987721
-
-            # *.iml
-            # modules.xml
-            # .idea/misc.xml
-            # *.ipr
-
-            # Sonarlint plugin
-            .idea/sonarlint
-
-            ### Python ###
-            # Byte-compiled / optimized / DLL files
-            __pycache__/
-            *.py[cod]
-            *$py.class
-
-            # C extensions
-            *.so
-
-            # Distribution / packaging
-            .Python
-            build/
-            develop-eggs/
-            dist/
-            downloads/
-            eggs/
-            .eggs/
-            lib/
-            lib64/
-            parts/
-            sdist/
-            var/
-            wheels/
-            *.egg-info/
-            .installed.cfg
-            *.egg
-
-            # PyInstaller
-            #  Usually these files are written by a python script from a template
-            #  before PyInstaller builds the exe, so as to inject date/other infos into it.
-            *.manifest
-            *.spec
-
-            # Installer logs
-            pip-log.txt
-            pip-delete-this-directory.txt
-
-            # Unit test / coverage reports
-            htmlcov/
-            .tox/
-            .coverage
-            .coverage.*
-            .cache
-            .pytest_cache/
-            nosetests.xml
-            coverage.xml
-            *.cover
-            .hypothesis/
-
-            # Translations
-            *.mo
-            *.pot
-
-            # Flask stuff:
-            instance/
-            .webassets-cache
-
-            # Scrapy stuff:
-            .scrapy
-
-            # Sphinx documentation
-            docs/_build/
-            autoapi
-
-            # mkdocs docs
-            site/
-
-            # PyBuilder
-            target/
-
-            # Jupyter Notebook
-            .ipynb_checkpoints
-            *.ipynb*
-
-            # pyenv
-            .python-version
-
-            # celery beat schedule file
-            celerybeat-schedule.*
-
-            # SageMath parsed files
-            *.sage.py
-
-            # Environments
-            .venv
-            env/
-            venv/
-            ENV/
-            env.bak/
-            venv.bak/
-            {project_env}
-
-            # Spyder project settings
-            .spyderproject
-            .spyproject
-
-            # Rope project settings
-            .ropeproject
-
-            # mkdocs documentation
-            /site
-
-            # mypy
-            .mypy_cache/
-
-            ### VisualStudioCode ###
-            .vscode/*
-            !.vscode/settings.json
-            !.vscode/tasks.json
-            !.vscode/launch.json
-            !.vscode/extensions.json
-            .history
-
-            ### Windows ###
-            # Windows thumbnail cache files
-            Thumbs.db
-            ehthumbs.db
-            ehthumbs_vista.db
-
-            # Folder config file
-            Desktop.ini
-
-            # Recycle Bin used on file shares
-            $RECYCLE.BIN/
-
-            # Windows Installer files
-            *.cab
-            *.msi
-            *.msm
-            *.msp
-
-            # Windows shortcuts
-            *.lnk
-
-            # Build folder
-
-            */build/*
-
-            # Chalice build
-            .chalice/deployments/
-
-            # charts
-            *.pdf
-            *.pptx
-
-            # text documents
-            *.doc
-            *.docx
-
-            # xlsx and csv
-            *.xls
-            *.xlsx
-            *.csv
-
-            # JPEG
-            *.jpg
-            *.jpeg
-            *.jpe
-            *.jif
-            *.jfif
-            *.jfi
-
-            # JPEG 2000
-            *.jp2
-            *.j2k
-            *.jpf
-            *.jpx
-            *.jpm
-            *.mj2
-
-            # JPEG XR
-            *.jxr
-            *.hdp
-            *.wdp
-
-            # Graphics Interchange Format
-            *.gif
-
-            # RAW
-            *.raw
-
-            # Web P
-            *.webp
-
-            # Portable Network Graphics
-            *.png
-
-            # Animated Portable Network Graphics
-            *.apng
-
-            # Multiple-image Network Graphics
-            *.mng
-
-            # Tagged Image File Format
-            *.tiff
-            *.tif
-
-            # Scalable Vector Graphics
-            *.svg
-            *.svgz
-
-            # Portable Document Format
-            *.pdf
+# `fireup --help` and `fireup --version` only pay for the modules above and for this module's own
+# definitions: other modules are imported inside the functions that need them, and the templates
+# live in `fire_up_templates`, which is only imported when a project is rendered
+IMPORT_TIME_BUDGET_MS = 10
 
-            # X BitMap
-            *.xbm
+# the optional components registered by `fire_up_templates`, listed in the command line help
+COMPONENT_NAMES = ('hydra', 'dashboard', 'docker', 'docs', 'notebooks', 'cdk')
 
-            # BMP
-            *.bmp
-            *.dib
-
-            # data
-            /data/
-
-            # End of https://www.gitignore.io/api/osx,linux,python,windows,pycharm,visualstudiocode
-            '''
-            )
-
-        dockerfile = format_code(
-            f'''
-            # Copyright (c).
-            # Confidential and intended for internal use only.
-
-            # base image
-            ARG BASE_CONTAINER=python:3.7
-            FROM $BASE_CONTAINER
-
-            # ENV AWS_PROFILE=ambiente-dev
-
-            LABEL maintainer="{author} <{email}>"
-
-            # Copy project files
-            # COPY ./ /./
-            COPY . /
-
-            # streamlit-specific commands
-            RUN mkdir -p /root/.streamlit
-            RUN bash -c 'echo -e "\\
-            [general]\\n\\
-            email = \\"\\"\\n\\
-            " > /root/.streamlit/credentials.toml'
-            RUN bash -c 'echo -e "\\
-            [server]\\n\\
-            enableCORS = false\\n\\
-            " > /root/.streamlit/config.toml'
-
-            # exposing default port for streamlit
-            EXPOSE 8501
-
-            # copy over and install packages
-            # RUN pip install -r ./requirements.txt
-            RUN pip install -e .
-
-            # run app
-            CMD streamlit run ./dashboard/app.py # -- --profile $AWS_PROFILE --server.headless false
-            '''
-            )
-
-        docker_compose = format_code(
-            f'''
-            version: '3'
-
-            services:
-              dashboard:
-                build:
-                  context: .
-                  dockerfile: ./docker/dashboard/Dockerfile
-                image:
-                ports:
-                 - "80:8501"
-                volumes:
-                 - C:/Users/a00018578/.aws:/root/.aws
-                 - ./dashboard:/src
-            '''
-            )
-
-        dockerignore = format_code(
-            f'''
-            **/.git
-            **/.vscode
-            **/__pycache__
-            **/docs
-            **/{project_name}.egg-info
-            **/{project_env}
-            **/notebooks
-            '''
-            )
-
-        makefile = format_code(
-            f'''
-            include config.mk
-
-            ## __LAUNCH_FROM_BASE_ENV__ create-env: initialize python virtual enviroment
-            .PHONY: create-env
-            create-env:
-            	virtualenv $(ENV_NAME)
-
-            ## activate-env: activate python virtual enviroment
-            .PHONY: activate-env
-            activate-env:
-            	@echo "Command stored! You can past and run it in the CLI."
-            	@echo "$(ENV_NAME)\\Scripts\\activate.bat" | clip
-
-            ## init: initialize package basic dependencies
-            .PHONY: init
-            init:
-            	$(PYTHON) -m pip install -r ./requirements.txt
-
-            ## register-env: register virtual enviroment in jupyter suite
-            .PHONY: register-env
-            register-env:
-            	$(PYTHON) -m ipykernel install --user --name=$(ENV_NAME)
-
-            ## reqs: save requirements.txt with pipreqs
-            .PHONY: reqs
-            reqs:
-            	pipreqs ./ --encoding latin --ignore $(ENV_NAME)
-
-            ## install-package: install python package in edit mode
-            .PHONY: install-package
-            install-package:
-            	$(PYTHON) -m pip install -e .
-
-            ## streamlit-run: run streamlit app
-            .PHONY: streamlit-run
-            streamlit-run:
-            	cd ./dashboard && streamlit run app.py
-
-            ## docs-serve: serve package docs on localhost
-            .PHONY: docs-serve
-            docs-serve:
-            	mkdocs serve
-
-            ## docs-build: build package docs as static html website
-            .PHONY: docs-build
-            docs-build:
-            	mkdocs build --no-directory-urls
-
-            ## test: execute tests with pytest and dump html report
-            .PHONY: test
-            test:
-            	cd tests && $(PYTHON) test_loguru.py && pytest --html=pytest-report.html
-
-            .PHONY: help
-            help: Makefile
-            	@sed -n 's/^## //p' $<
-            '''
-            )
-
-        make_config = format_code(
-            f'''
-            ENV_NAME = {project_env}
-            PYTHON = $(ENV_NAME)/Scripts/python.exe
-            '''
-            )
-
-        mkdocs_config = format_code(
-            f'''
-            site_name: {project_name_str}
-            site_url: http://localhost/
-
-            nav:
-              - Home: index.md
-
-            theme:
-              name: "material"
-              palette:
-                scheme: slate
-                primary: orange
-                accent: amber
-              features:
-                - tabs
-
-            markdown_extensions:
-                - toc:
-                    permalink: True
-
-            plugins:
-              - search
-              - mkdocstrings
-
-            extra_css:
-              - css/mkdocstrings.css
-            '''
-            )
-
-        mkdocs_css = format_code(
-            '''
-            div.doc-contents:not(.first) {
-            padding-left: 25px;
-            border-left: 4px solid rgba(150, 150, 150);
-            margin-bottom: 80px;
-            }
-
-            h5.doc-heading {
-            text-transform: none !important;
-            }
-
-            h6.hidden-toc {
-            margin: 0 !important;
-            position: relative;
-            top: -70px;
-            }
-
-            h6.hidden-toc::before {
-            margin-top: 0 !important;
-            padding-top: 0 !important;
-            }
-
-            h6.hidden-toc a.headerlink {
-            display: none;
-            }
-
-            td code {
-            word-break: normal !important;
-            }
-
-            td p {
-            margin-top: 0 !important;
-            margin-bottom: 0 !important;
-            }
-            '''
-            )
-
-        dotenv = format_code(
-            f'''
-            LOGURU_LEVEL='DEBUG'
-            '''
-            )
-
-        package_init = format_code(
-            f'''
-            from dotenv import load_dotenv
-            load_dotenv()
-
-            import hydra.experimental as he
-            from hydra.core.global_hydra import GlobalHydra
-            from omegaconf import OmegaConf
-
-            def serve_config() -> dict:
-                GlobalHydra.instance().clear()
-                he.initialize(config_path="../config")
-                return OmegaConf.to_container(he.compose("config")) # type: ignore
-            '''
-            )
+# names kept importable from `fire_up`, resolved from `fire_up_templates` on first access
+TEMPLATE_NAMES = (
+    'FireUp', 'Component', 'COMPONENTS', 'component', 'resolve_components', 'OPTIONS', 'REQUIREMENT_GROUPS', 'requirement_groups'
+    )
 
-        test_pytest = format_code(
-            f'''
-            # pytest (create make command to execute test with pytest --html=pytest_report.html)
-            class TestClass:
-                def test_passed(self):
-                    x = "cane"
-                    assert "c" in x
-
-                def test_failed(self):
-                    x = "gatto"
-                    assert hasattr(x, "check")
-            '''
+def __getattr__(name):
+    if name in TEMPLATE_NAMES:
+        import fire_up_templates
+        return getattr(fire_up_templates, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def measure_import_time(module='fire_up', repeat=5):
+    # best self import time of `module` in milliseconds (its own body, without the modules it imports),
+    # as reported by `python -X importtime` over `repeat` fresh interpreters
+    import subprocess
+    import py_compile
+    import importlib.util
+    try:
+        # time the import of up-to-date bytecode, as installed, rather than the compilation of the source
+        py_compile.compile(importlib.util.find_spec(module).origin, doraise=True)
+    except (py_compile.PyCompileError, OSError):
+        pass
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
             )
-
-        test_loguru = format_code(
-            f'''
-            from dotenv import load_dotenv
-            load_dotenv()
-            from loguru import logger
-
-            logger.debug("this is a debugging message")
-            logger.info("this is an informational message")
-            logger.warning("this is a warning message")
-            logger.error("this is an error message")
-            logger.critical("this is a critical message")
-
-            print('')
-
-            @logger.catch
-            def divide_by(x):
-                return 1 / x
-
-            if __name__ == '__main__':
-                divide_by(0)
-            '''
+        for line in result.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                timings.append(int(fields[0].split(':')[-1]) / 1000)
+                break
+        else:
+            raise RuntimeError(f'No import time reported for {module}')
+    return min(timings)
+
+def cache_dir():
+    # per-user FireUp cache folder, following XDG_CACHE_HOME when set
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'fireup')
+
+def default_wheelhouse():
+    return os.environ.get('FIREUP_WHEELHOUSE') or os.path.join(cache_dir(), 'wheelhouse')
+
+class RenderCache:
+
+    # bump to invalidate every entry written by a previous cache layout
+    version = 1
+
+    def __init__(self, path=None, max_bytes=64 * 1024 * 1024):
+        self.path = path or os.environ.get('FIREUP_CACHE_DIR') or cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.memory = collections.OrderedDict()
+        self.memory_entries = 1024
+        self.size = None
+        import threading
+        self.lock = threading.Lock()
+
+    def key(self, template, variables):
+        import hashlib
+        digest = hashlib.sha256(f'v{self.version}'.encode('utf-8'))
+        digest.update(template.encode('utf-8'))
+        for name, value in sorted(variables.items()):
+            digest.update(b'\0' + name.encode('utf-8') + b'=' + str(value).encode('utf-8'))
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, 'renders', key[:2], key)
+
+    def get(self, key):
+        with self.lock:
+            content = self.memory.get(key)
+        if content is None:
+            try:
+                with open(self.entry_path(key), 'rb') as file:
+                    content = file.read()
+                # the mtime doubles as the last access time for LRU eviction
+                os.utime(self.entry_path(key))
+            except OSError:
+                content = None
+        with self.lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.remember(key, content)
+        return content
+
+    def remember(self, key, content):
+        # bounded in-memory LRU layer in front of the on-disk entries
+        self.memory[key] = content
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def put(self, key, content):
+        with self.lock:
+            self.remember(key, content)
+        path = self.entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write aside and rename so that concurrent generations never read a partial entry
+            import threading
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            # a read-only or full cache directory must never break generation
+            return
+        with self.lock:
+            if self.size is None:
+                self.size = sum(size for _, size, _ in self.entries())
+            else:
+                self.size += len(content)
+            if self.size > self.max_bytes:
+                self.evict()
+
+    def entries(self):
+        # yield (path, size, mtime) for every stored render
+        root = os.path.join(self.path, 'renders')
+        if not os.path.isdir(root):
+            return
+        for bucket in os.scandir(root):
+            if bucket.is_dir():
+                for entry in os.scandir(bucket.path):
+                    if entry.name.endswith('.tmp'):
+                        continue
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def evict(self):
+        # drop least recently used entries until the cache is back to 3/4 of its budget
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        self.size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self.size <= self.max_bytes * 3 // 4:
+                break
+            try:
+                os.remove(path)
+                self.size -= size
+            except OSError:
+                pass
+
+    def flush_stats(self):
+        # merge this process' hit/miss counters into the persistent statistics, once per process (see
+        # `get_render_cache`): the read-modify-write is serialized between threads by the lock and
+        # between processes, such as the workers of `fireup batch --executor process`, by a lock file
+        import json
+        import threading
+        with self.lock:
+            hits, misses = self.hits, self.misses
+            self.hits = self.misses = 0
+            if not hits and not misses:
+                return
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                with open(os.path.join(self.path, 'stats.lock'), 'w') as lock_file:
+                    try:
+                        import fcntl
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    except ImportError:
+                        pass
+                    stats = self.load_stats()
+                    stats['hits'] += hits
+                    stats['misses'] += misses
+                    tmp_path = os.path.join(self.path, f'stats.json.{os.getpid()}.{threading.get_ident()}.tmp')
+                    with open(tmp_path, 'w') as file:
+                        json.dump(stats, file)
+                    os.replace(tmp_path, os.path.join(self.path, 'stats.json'))
+            except OSError:
+                pass
+
+    def load_stats(self):
+        import json
+        try:
+            with open(os.path.join(self.path, 'stats.json')) as file:
+                stats = json.load(file)
+        except (OSError, ValueError):
+            stats = {}
+        return {'hits': stats.get('hits', 0), 'misses': stats.get('misses', 0)}
+
+    def stats(self):
+        stats = self.load_stats()
+        sizes = [size for _, size, _ in self.entries()]
+        stats.update(entries=len(sizes), bytes=sum(sizes), max_bytes=self.max_bytes, path=self.path)
+        return stats
+
+    def clear(self):
+        # only the renders and their statistics: the cache root also holds the default wheelhouse and
+        # blob store, which projects generated with --wheelhouse or --link-mode still depend on
+        import glob
+        import shutil
+        with self.lock:
+            self.memory.clear()
+            self.size = None
+            self.hits = self.misses = 0
+        shutil.rmtree(os.path.join(self.path, 'renders'), ignore_errors=True)
+        for path in glob.glob(os.path.join(glob.escape(self.path), 'stats.*')):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def template_variables(template):
+    # names of the replacement fields a `str.format` template actually uses
+    import string
+    return {field.split('.')[0].split('[')[0] for _, field, _, _ in string.Formatter().parse(template) if field}
+
+def render_template(template, context, cache=None):
+    # dedent and format a template into bytes, going through the cache when one is given
+    import textwrap
+    render = lambda: textwrap.dedent(template).strip().format(**context).encode('utf-8')
+    if cache is None:
+        return render()
+    key = cache.key(template, {name: context[name] for name in template_variables(template)})
+    content = cache.get(key)
+    if content is None:
+        content = render()
+        cache.put(key, content)
+    return content
+
+_render_cache = None
+
+def get_render_cache():
+    # one cache per process, so that batch generations share its in-memory layer
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache()
+        # statistics are flushed when the process exits: multiprocessing finalizers run then, and unlike
+        # atexit callbacks they also run in the workers of a process pool
+        import multiprocessing.util
+        multiprocessing.util.Finalize(None, _render_cache.flush_stats, exitpriority=0)
+    return _render_cache
+
+# immutable result of the rendering phase: `root` is the project folder name, `dirs` the
+# relative directories to create (parents first), `files` a read-only mapping of
+# relative path -> content bytes (or `StaticFile`) and `templates` a read-only mapping of relative path ->
+# template id, i.e. the path before formatting, stable across runs and inputs
+RenderedTree = collections.namedtuple('RenderedTree', ['root', 'dirs', 'files', 'templates'])
+
+# generation manifest written at the project root and used by `fireup update`
+MANIFEST = '.fireup.json'
+
+class StaticFile:
+
+    # content of a template pack static asset, left on disk until a sink streams it to its
+    # destination: `len()` is its size and its hash comes from the pack index, so it is never read
+    __slots__ = ('source', 'size', 'hash')
+
+    def __init__(self, source, size, hash):
+        self.source = source
+        self.size = size
+        self.hash = hash
+
+    def __len__(self):
+        return self.size
+
+    def open(self):
+        return open(self.source, 'rb')
+
+def content_hash(content):
+    if isinstance(content, StaticFile):
+        return content.hash
+    import hashlib
+    return hashlib.sha256(content).hexdigest()
+
+def file_hash(path, chunk_size=1024 * 1024):
+    # same hash as `content_hash`, reading the file in chunks
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BlobStore:
+
+    # content-addressed store of the files shared by generated projects: blobs are named after the
+    # hash of their content, written once and made read-only, so that projects can link to them
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('FIREUP_BLOB_DIR') or os.path.join(cache_dir(), 'blobs')
+
+    def blob_path(self, digest):
+        return os.path.join(self.path, digest[:2], digest[2:])
+
+    def put(self, content):
+        # path of the blob holding `content`, stored on first use
+        path = self.blob_path(content_hash(content))
+        if not os.path.exists(path):
+            import shutil
+            import threading
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # concurrent writers race on a rename, never on a partially written blob
+            partial = f'{path}.{os.getpid()}.{threading.get_ident()}.partial'
+            if isinstance(content, StaticFile):
+                shutil.copyfile(content.source, partial)
+            else:
+                with open(partial, 'wb') as file:
+                    file.write(content)
+            os.chmod(partial, 0o444)
+            os.replace(partial, path)
+        return path
+
+    def stats(self):
+        entries = size = 0
+        for dirpath, _, filenames in os.walk(self.path):
+            for filename in filenames:
+                entries += 1
+                size += os.path.getsize(os.path.join(dirpath, filename))
+        return {'path': self.path, 'entries': entries, 'bytes': size}
+
+    def clear(self):
+        import shutil
+        # blobs are read-only, their folders are not
+        shutil.rmtree(self.path, ignore_errors=True)
+
+_blob_store = None
+
+def get_blob_store():
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = BlobStore()
+    return _blob_store
+
+def reflink(source, destination):
+    # copy-on-write clone of `source` (Linux FICLONE ioctl, e.g. on btrfs or XFS), OSError when unsupported
+    try:
+        import fcntl
+    except ImportError:
+        # Windows: the sink falls back to the next link method
+        raise OSError('reflinks are not supported on this platform')
+    ficlone = getattr(fcntl, 'FICLONE', 0x40049409)
+    with open(source, 'rb') as src:
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            fcntl.ioctl(fd, ficlone, src.fileno())
+        except OSError:
+            os.close(fd)
+            os.unlink(destination)
+            raise
+        os.close(fd)
+
+class Tracer:
+
+    # per-phase and per-file timings; FireUp and the sinks only call into it when one is given
+    def __init__(self):
+        self.events = []
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+    def add(self, name, category, start, end, **args):
+        import threading
+        # list.append is atomic, so concurrent sinks can record without a lock
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ts': (start - self.origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'tid': threading.get_ident(),
+            'args': args
+            })
+
+    def span(self, name, category='phase', **args):
+        return TraceSpan(self, name, category, args)
+
+    def summary(self, top=10):
+        # human readable table: phases in order, then the slowest files; syscall counts are estimated by
+        # the sinks from the calls they make (see `write_file`), they are not traced from the kernel
+        phases = [event for event in self.events if event['cat'] != 'file']
+        files = sorted((event for event in self.events if event['cat'] == 'file'), key=lambda event: -event['dur'])
+        lines = [f"{'phase':<40}{'ms':>10}"]
+        lines += [f"{event['name']:<40}{event['dur'] / 1000:>10.3f}" for event in sorted(phases, key=lambda event: event['ts'])]
+        if files:
+            total_bytes = sum(event['args'].get('bytes', 0) for event in files)
+            total_syscalls = sum(event['args'].get('syscalls', 0) for event in files)
+            lines.append('')
+            lines.append(f'{len(files)} files, {total_bytes} bytes, ~{total_syscalls} syscalls (estimated), slowest:')
+            lines.append(f"{'file':<40}{'ms':>10}{'bytes':>10}{'~syscalls':>10}")
+            lines += [
+                f"{event['name']:<40}{event['dur'] / 1000:>10.3f}{event['args'].get('bytes', 0):>10}{event['args'].get('syscalls', 0):>10}"
+                for event in files[:top]
+                ]
+        return '\n'.join(lines)
+
+    def dump(self, path, trace_format='chrome'):
+        # `chrome` is the trace event format read by chrome://tracing and Perfetto, `jsonl` one event per line
+        import json
+        with open(path, 'w') as file:
+            if trace_format == 'jsonl':
+                for event in self.events:
+                    file.write(json.dumps(event) + '\n')
+            else:
+                events = [dict(event, ph='X', pid=self.pid) for event in self.events]
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+class TraceSpan:
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        if self.tracer is not None:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.tracer is not None:
+            self.tracer.add(self.name, self.category, self.start, time.perf_counter(), **self.args)
+
+# shared no-op span used when tracing is disabled
+NULL_SPAN = TraceSpan(None, None, None, None)
+
+def trace(tracer, name, category='phase', **args):
+    return NULL_SPAN if tracer is None else tracer.span(name, category, **args)
+
+def default_jobs():
+    # threads for I/O bound work, as many as ThreadPoolExecutor uses by default
+    return min(32, (os.cpu_count() or 1) + 4)
+
+def unlink_existing(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+class DirectorySink:
+
+    # estimated syscalls per file for a buffered `open` (open, fstat, ioctl), `write` and `close`
+    syscalls_per_file = 5
+    # files of an existing project are replaced rather than written through: a previous generation with
+    # `--link-mode hardlink` may share their inode with the blob store and every other project
+    replace_files = True
+
+    def __init__(self, target_dir, tracer=None):
+        self.target_dir = target_dir
+        self.tracer = tracer
+
+    def write(self, tree):
+        root_dir = f'{self.target_dir}/{tree.root}'
+        # a new project has nothing to replace, which spares an unlink per file
+        self.replace_files = os.path.isdir(root_dir)
+        with trace(self.tracer, 'mkdir', dirs=len(tree.dirs) + 1):
+            os.makedirs(root_dir, exist_ok=True)
+            for dir_ in tree.dirs:
+                os.makedirs(f'{root_dir}/{dir_}', exist_ok=True)
+        with trace(self.tracer, 'write files', files=len(tree.files)):
+            for path, content in tree.files.items():
+                if self.tracer is None:
+                    self.write_file(f'{root_dir}/{path}', content)
+                else:
+                    start = time.perf_counter()
+                    self.write_file(f'{root_dir}/{path}', content)
+                    self.tracer.add(path, 'file', start, time.perf_counter(), bytes=len(content), syscalls=self.syscalls_per_file + self.replace_files)
+        return root_dir
+
+    def write_file(self, path, content):
+        if self.replace_files:
+            unlink_existing(path)
+        if isinstance(content, StaticFile):
+            import shutil
+            shutil.copyfile(content.source, path)
+            return
+        with open(path, 'wb') as file:
+            file.write(content)
+
+class ConcurrentDirectorySink:
+
+    # one open/write/close per file, without Python's buffered file object machinery
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    replace_files = True
+
+    def __init__(self, target_dir, jobs=None, tracer=None):
+        self.target_dir = target_dir
+        self.jobs = jobs or default_jobs()
+        self.tracer = tracer
+
+    def write(self, tree):
+        root_dir = f'{self.target_dir}/{tree.root}'
+        # files of an existing project are replaced, see `DirectorySink.replace_files`
+        self.replace_files = os.path.isdir(root_dir)
+        with trace(self.tracer, 'mkdir', dirs=len(tree.dirs) + 1):
+            os.makedirs(root_dir, exist_ok=True)
+            # `tree.dirs` lists parents first, so the whole skeleton is a single mkdir per directory
+            for dir_ in tree.dirs:
+                try:
+                    os.mkdir(f'{root_dir}/{dir_}')
+                except FileExistsError:
+                    pass
+        if self.tracer is None:
+            write_file = lambda item: self.write_file(f'{root_dir}/{item[0]}', item[1])
+        else:
+            write_file = lambda item: self.write_traced(root_dir, *item)
+        with trace(self.tracer, 'write files', files=len(tree.files), jobs=self.jobs):
+            if self.jobs == 1:
+                for item in tree.files.items():
+                    write_file(item)
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                    # consume the iterator so that the first write error is raised here
+                    for _ in pool.map(write_file, tree.files.items()):
+                        pass
+        return root_dir
+
+    def write_traced(self, root_dir, path, content):
+        start = time.perf_counter()
+        syscalls = self.write_file(f'{root_dir}/{path}', content)
+        self.tracer.add(path, 'file', start, time.perf_counter(), bytes=len(content), syscalls=syscalls)
+
+    def write_file(self, path, content):
+        # returns the number of syscalls issued, exact for rendered content and estimated for copies
+        syscalls = 0
+        if self.replace_files:
+            unlink_existing(path)
+            syscalls += 1
+        if isinstance(content, StaticFile):
+            # copied in the kernel where possible (sendfile), estimated as two open/close pairs and two copies
+            import shutil
+            shutil.copyfile(content.source, path)
+            return syscalls + 6
+        fd = os.open(path, self.flags, 0o666)
+        syscalls += 2
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+                syscalls += 1
+        finally:
+            os.close(fd)
+        return syscalls
+
+class LinkedDirectorySink(ConcurrentDirectorySink):
+
+    # files shared by every project (`FireUp.shared_paths`) are materialized from a blob store instead
+    # of being written again: reflinked (copy on write), hardlinked (the read-only blob inode itself)
+    # or, when the filesystem supports neither, copied
+    links_shared_files = True
+    methods = {'auto': ('reflink', 'hardlink', 'copy'), 'reflink': ('reflink', 'copy'), 'hardlink': ('hardlink', 'copy')}
+
+    def __init__(self, target_dir, store, mode='auto', jobs=None, tracer=None):
+        import threading
+        super().__init__(target_dir, jobs=jobs, tracer=tracer)
+        self.store = store
+        self.mode = mode
+        self.shared = frozenset()
+        self.report = {'reflink': 0, 'hardlink': 0, 'copy': 0, 'bytes_saved': 0}
+        self.lock = threading.Lock()
+
+    def write(self, tree, shared=frozenset()):
+        self.shared = frozenset(f'{self.target_dir}/{tree.root}/{path}' for path in shared)
+        return super().write(tree)
+
+    def write_file(self, path, content):
+        if path not in self.shared:
+            return super().write_file(path, content)
+        syscalls = 0
+        if self.replace_files:
+            # a link fails on an existing file
+            unlink_existing(path)
+            syscalls += 1
+        import shutil
+        blob = self.store.put(content)
+        for method in self.methods[self.mode]:
+            try:
+                if method == 'reflink':
+                    reflink(blob, path)
+                elif method == 'hardlink':
+                    os.link(blob, path)
+                else:
+                    shutil.copyfile(blob, path)
+                break
+            except OSError:
+                if method == 'copy':
+                    raise
+        with self.lock:
+            self.report[method] += 1
+            if method != 'copy':
+                self.report['bytes_saved'] += len(content)
+        # estimated: stat and link (or open, ioctl and close)
+        return syscalls + (2 if method == 'hardlink' else 4)
+
+def default_staging_dir():
+    # memory backed when available, so that staging costs no disk I/O
+    staging_dir = os.environ.get('FIREUP_STAGING_DIR')
+    if staging_dir:
+        return staging_dir
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    import tempfile
+    return tempfile.gettempdir()
+
+class StagedSink:
+
+    # writes the project into a scratch folder (tmpfs by default), then moves it into place in one step:
+    # a rename on the same filesystem, otherwise a concurrent copy next to the destination followed by
+    # a rename, so that the destination is either missing or complete, even when the run fails;
+    # `before_move(staged_root, tree)` completes the staged project first (e.g. its git repository)
+    def __init__(self, target_dir, staging_dir=None, jobs=None, tracer=None, before_move=None):
+        self.target_dir = target_dir
+        self.staging_dir = staging_dir or default_staging_dir()
+        self.jobs = jobs or default_jobs()
+        self.tracer = tracer
+        self.before_move = before_move
+
+    def write(self, tree):
+        import shutil
+        import tempfile
+        root_dir = f'{self.target_dir}/{tree.root}'
+        if os.path.lexists(root_dir):
+            raise FileExistsError(f'{root_dir} already exists, staged generation only creates new projects')
+        os.makedirs(self.target_dir, exist_ok=True)
+        stage = tempfile.mkdtemp(prefix='fireup-stage-', dir=self.staging_dir)
+        try:
+            with trace(self.tracer, 'stage', staging_dir=self.staging_dir):
+                staged_root = ConcurrentDirectorySink(stage, jobs=self.jobs, tracer=self.tracer).write(tree)
+                if self.before_move is not None:
+                    self.before_move(staged_root, tree)
+            with trace(self.tracer, 'move into place'):
+                self.move(staged_root, root_dir, tree)
+        finally:
+            shutil.rmtree(stage, ignore_errors=True)
+        return root_dir
+
+    def move(self, staged_root, root_dir, tree):
+        import errno
+        try:
+            os.rename(staged_root, root_dir)
+            return
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+        # another filesystem: copy to a hidden sibling of the destination, then rename it
+        import shutil
+        import threading
+        partial = f'{self.target_dir}/.{tree.root}.partial-{os.getpid()}-{threading.get_ident()}'
+        try:
+            os.mkdir(partial)
+            # the staged folder is walked rather than the tree, which misses what `before_move` added
+            paths = []
+            for dirpath, dirnames, filenames in os.walk(staged_root):
+                rel_dir = os.path.relpath(dirpath, staged_root)
+                for name in dirnames:
+                    os.mkdir(os.path.join(partial, rel_dir, name))
+                paths += [os.path.join(rel_dir, name) for name in filenames]
+            copy_file = lambda path: shutil.copyfile(os.path.join(staged_root, path), os.path.join(partial, path))
+            with trace(self.tracer, 'copy', files=len(paths), jobs=self.jobs):
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                    for _ in pool.map(copy_file, paths):
+                        pass
+            os.rename(partial, root_dir)
+        except BaseException:
+            shutil.rmtree(partial, ignore_errors=True)
+            raise
+
+class ArchiveSink:
+
+    # archive formats and the matching `tarfile` stream modes (`None` for zip)
+    formats = {'tar': 'w|', 'tar.gz': 'w|gz', 'zip': None}
+
+    def __init__(self, output=None, output_format='tar', target_dir='.', mtime=None, tracer=None):
+        if output_format not in self.formats:
+            raise ValueError(f'Unsupported archive format: {output_format}')
+        self.output = output
+        self.output_format = output_format
+        self.target_dir = target_dir
+        self.mtime = mtime
+        self.tracer = tracer
+
+    def write(self, tree):
+        output = self.output or f'{self.target_dir}/{tree.root}.{self.output_format}'
+        mtime = self.mtime if self.mtime is not None else time.time()
+        # archives are written in streaming mode, so no part of them is buffered or read back
+        stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+        try:
+            with trace(self.tracer, f'write {self.output_format}', files=len(tree.files)):
+                if self.output_format == 'zip':
+                    self.write_zip(stream, tree, mtime)
+                else:
+                    self.write_tar(stream, tree, mtime)
+        finally:
+            if output == '-':
+                stream.flush()
+            else:
+                stream.close()
+        return output
+
+    def write_tar(self, stream, tree, mtime):
+        import io
+        import tarfile
+        with tarfile.open(fileobj=stream, mode=self.formats[self.output_format]) as archive:
+            for dir_ in ('',) + tree.dirs:
+                info = tarfile.TarInfo(f'{tree.root}/{dir_}'.rstrip('/'))
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                info.mtime = mtime
+                archive.addfile(info)
+            for path, content in tree.files.items():
+                info = tarfile.TarInfo(f'{tree.root}/{path}')
+                info.size = len(content)
+                info.mode = 0o644
+                info.mtime = mtime
+                if isinstance(content, StaticFile):
+                    with content.open() as source:
+                        archive.addfile(info, source)
+                else:
+                    archive.addfile(info, io.BytesIO(content))
+
+    def write_zip(self, stream, tree, mtime):
+        import zipfile
+        date_time = time.localtime(mtime)[:6]
+        with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for dir_ in ('',) + tree.dirs:
+                info = zipfile.ZipInfo(f'{tree.root}/{dir_}'.rstrip('/') + '/', date_time=date_time)
+                # unix mode in the high bits, MS-DOS directory flag in the low ones
+                info.external_attr = (0o40755 << 16) | 0x10
+                archive.writestr(info, b'')
+            for path, content in tree.files.items():
+                info = zipfile.ZipInfo(f'{tree.root}/{path}', date_time=date_time)
+                info.external_attr = 0o100644 << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                if isinstance(content, StaticFile):
+                    import shutil
+                    with content.open() as source, archive.open(info, 'w') as target:
+                        shutil.copyfileobj(source, target)
+                else:
+                    archive.writestr(info, content)
+
+class DryRunSink:
+
+    def __init__(self, target_dir='.', stream=None):
+        self.target_dir = target_dir
+        self.stream = stream
+
+    def write(self, tree):
+        root_dir = f'{self.target_dir}/{tree.root}'
+        for dir_ in tree.dirs:
+            click.echo(f'{root_dir}/{dir_}/', file=self.stream)
+        for path, content in tree.files.items():
+            click.echo(f'{root_dir}/{path} ({len(content)} bytes)', file=self.stream)
+        return root_dir
+
+def build_wheelhouse(wheelhouse, components=None, python=None):
+    # download or build wheels for every generated dependency, plus what pip needs to install offline
+    import subprocess
+    from fire_up_templates import requirement_groups, resolve_components
+    packages = [package for packages in requirement_groups(resolve_components(components)).values() for package in packages]
+    packages += ['pip', 'setuptools', 'wheel']
+    os.makedirs(wheelhouse, exist_ok=True)
+    subprocess.run(
+        [python or sys.executable, '-m', 'pip', 'wheel', '--wheel-dir', wheelhouse, '--find-links', wheelhouse] + packages,
+        check=True
+        )
+    return sorted(name for name in os.listdir(wheelhouse) if name.endswith('.whl'))
+
+# index of a template pack, written at its root by `fireup pack index`
+PACK_INDEX = 'fireup-pack.json'
+
+class TemplatePack:
+
+    # external templates: files under `<component>/` folders of the pack (`core/` for those always
+    # rendered), at the path they get in the project; `.tmpl` files are `str.format` templates
+    # rendered like the built-in ones, every other file a static asset copied as is
+
+    def __init__(self, root, index=None):
+        self.root = root
+        self.index = index or self.load_index()
+        self.sources = {}
+
+    def load_index(self):
+        import json
+        try:
+            with open(os.path.join(self.root, PACK_INDEX), encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            # unindexed packs work, but are walked and hashed on every run
+            return build_pack_index(self.root)
+
+    def read(self, source):
+        if source not in self.sources:
+            with open(os.path.join(self.root, source), encoding='utf-8') as file:
+                self.sources[source] = file.read()
+        return self.sources[source]
+
+    def render(self, project):
+        # only the templates of the selected components are read, static assets are not read at all
+        selected = ('core',) + project.components
+        entries = [entry for entry in self.index['files'] if entry['component'] in selected]
+        for entry in entries:
+            missing = set(entry.get('variables', ())).difference(project.context)
+            if missing:
+                raise ValueError(f"Template {entry['source']} of pack {self.root} uses unknown variables: {', '.join(sorted(missing))}")
+        dirs = [entry['path'] for entry in self.index['dirs'] if entry['component'] in selected]
+        files = {}
+        for entry in entries:
+            if entry['template']:
+                files[entry['path']] = project.render_template(self.read(entry['source']))
+                continue
+            # the size and hash of static assets come from the index: a stat matching it is enough (which does
+            # not read the file), a different modification time only means the file was copied, installed or
+            # checked out since it was indexed, so it is hashed again and trusted if its content is the same
+            source = os.path.join(self.root, entry['source'])
+            stat = os.stat(source)
+            if stat.st_size != entry['size'] or (
+                    stat.st_mtime_ns != entry.get('mtime_ns') and file_hash(source) != entry['hash']):
+                raise ValueError(
+                    f"Static file {entry['source']} of pack {self.root} changed since the pack was indexed, "
+                    f"run `fireup pack index {self.root}` again"
+                    )
+            files[entry['path']] = StaticFile(source, entry['size'], entry['hash'])
+        return dirs, files
+
+def build_pack_index(root, jobs=None):
+    # describe every file of a template pack: component, project path, kind, variables, size and hash
+    from fire_up_templates import COMPONENTS
+    dirs, sources = [], []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith(('.', '__pycache__')))
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        if rel_dir == '.':
+            # files at the root (the index, a README, a package `__init__.py`) belong to the pack itself
+            unknown = set(dirnames).difference(COMPONENTS, ['core'])
+            if unknown:
+                raise ValueError(f"Unknown component folders in template pack {root}: {', '.join(sorted(unknown))}")
+            continue
+        if '/' in rel_dir:
+            dirs.append(rel_dir)
+        sources += [f'{rel_dir}/{name}' for name in sorted(filenames) if not name.endswith('.pyc')]
+    # stat before hashing, so that a file changed meanwhile is found stale rather than trusted
+    stats = {source: os.stat(os.path.join(root, source)) for source in sources}
+    hashes = hash_files(root, sources, jobs=jobs)
+
+    split = lambda source: source.split('/', 1)
+    index = {'version': 2, 'dirs': [], 'files': []}
+    for rel_dir in dirs:
+        component, path = split(rel_dir)
+        index['dirs'].append({'component': component, 'path': path})
+    for source in sources:
+        component, path = split(source)
+        entry = {'source': source, 'component': component, 'path': path, 'template': path.endswith('.tmpl')}
+        entry['size'] = stats[source].st_size
+        # a hint for the stat fast path only, the size and hash identify the file
+        entry['mtime_ns'] = stats[source].st_mtime_ns
+        entry['hash'] = hashes[source]
+        if entry['template']:
+            with open(os.path.join(root, source), encoding='utf-8') as file:
+                entry['variables'] = sorted(template_variables(file.read()))
+            entry['path'] = path[:-len('.tmpl')]
+        index['files'].append(entry)
+    return index
+
+def find_pack(spec):
+    # a template pack folder, or the folder of an installed package (located without importing it)
+    if os.path.isdir(spec):
+        return os.path.abspath(spec)
+    import importlib.util
+    try:
+        found = importlib.util.find_spec(spec)
+    except (ImportError, ValueError):
+        found = None
+    if found is None or not found.submodule_search_locations:
+        raise ValueError(f'Template pack not found: {spec} is neither a folder nor an installed package')
+    return list(found.submodule_search_locations)[0]
+
+_packs = {}
+
+def load_pack(spec):
+    # one pack (and index) per process, so that batch generations share them
+    if spec not in _packs:
+        _packs[spec] = TemplatePack(find_pack(spec))
+    return _packs[spec]
+
+def hash_files(root_dir, paths, jobs=None):
+    # hash existing files in parallel, mapping missing ones to None
+    from concurrent.futures import ThreadPoolExecutor
+    def hash_file(path):
+        try:
+            return file_hash(f'{root_dir}/{path}')
+        except FileNotFoundError:
+            return None
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        return dict(zip(paths, pool.map(hash_file, paths)))
+
+def update_project(project_dir, jobs=None, cache=None, force=False, dry_run=False):
+    # re-apply the current templates to a generated project, returning {status: [paths]}
+    import json
+    from fire_up_templates import FireUp
+    try:
+        with open(f'{project_dir}/{MANIFEST}', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        raise click.ClickException(f'{project_dir} has no {MANIFEST}, it was not generated by this FireUp version.')
+    project = FireUp(
+        target_dir=os.path.dirname(os.path.abspath(project_dir)),
+        project_name=manifest['name'],
+        author=manifest['author'],
+        email=manifest['email'],
+        render_only=True,
+        cache=cache,
+        components=manifest['components'],
+        options=manifest.get('options')
+        )
+    tree = project.tree
+
+    # match files on their template id, so that e.g. a dated notebook keeps its original path
+    old_entries = {entry['template']: entry for entry in manifest['files']}
+    new_paths = {template: path for path, template in tree.templates.items() if path != MANIFEST}
+    targets = {template: old_entries[template]['path'] if template in old_entries else path for template, path in new_paths.items()}
+    disk_hashes = hash_files(project_dir, targets.values(), jobs=jobs)
+
+    report = {'updated': [], 'created': [], 'unchanged': [], 'conflicts': [], 'stale': []}
+    writes = {}
+    entries = []
+    for template, path in new_paths.items():
+        target = targets[template]
+        new_hash = content_hash(tree.files[path])
+        old_hash = old_entries[template]['hash'] if template in old_entries else None
+        disk_hash = disk_hashes[target]
+        if disk_hash == new_hash:
+            status = 'unchanged'
+        elif new_hash == old_hash:
+            # template unchanged, keep whatever the user did to the file
+            status = 'unchanged'
+        elif disk_hash is None and old_hash is None:
+            status = 'created'
+        elif disk_hash == old_hash:
+            status = 'updated'
+        else:
+            # both the template and the file (edited, deleted or pre-existing) changed
+            status = 'updated' if force else 'conflicts'
+        report[status].append(target)
+        if status in ('updated', 'created'):
+            writes[target] = tree.files[path]
+        # conflicting files keep their previous hash so that they are reported until resolved
+        recorded_hash = old_hash if status == 'conflicts' or (status == 'unchanged' and disk_hash != new_hash) else new_hash
+        entries.append({'path': target, 'template': template, 'hash': recorded_hash})
+    report['stale'] = [entry['path'] for template, entry in old_entries.items() if template not in new_paths]
+
+    if not dry_run and (writes or entries != manifest['files']):
+        sink = ConcurrentDirectorySink(project_dir, jobs=jobs)
+        for path, content in writes.items():
+            # the sink replaces existing files rather than truncating them
+            os.makedirs(os.path.dirname(f'{project_dir}/{path}'), exist_ok=True)
+            sink.write_file(f'{project_dir}/{path}', content)
+        manifest['files'] = entries
+        with open(f'{project_dir}/{MANIFEST}', 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+    return report
+
+def gitignore_matcher(text):
+    # predicate telling whether `git add .` skips a path under a .gitignore with this content: the last
+    # matching pattern wins, `!` re-includes, a `/` other than a trailing one anchors the pattern to
+    # the root, a trailing `/` only matches folders, and nothing is re-included from an ignored folder
+    import re
+    def glob_regex(pattern):
+        regex, i = '', 0
+        while i < len(pattern):
+            if pattern.startswith('**/', i):
+                regex, i = regex + '(?:.*/)?', i + 3
+            elif pattern.startswith('**', i):
+                regex, i = regex + '.*', i + 2
+            elif pattern[i] == '*':
+                regex, i = regex + '[^/]*', i + 1
+            elif pattern[i] == '?':
+                regex, i = regex + '[^/]', i + 1
+            elif pattern[i] == '[' and ']' in pattern[i + 2:]:
+                end = pattern.index(']', i + 2)
+                regex, i = regex + '[' + re.sub(r'^!', '^', pattern[i + 1:end]).replace('\\', '\\\\') + ']', end + 1
+            elif pattern[i] == '\\' and i + 1 < len(pattern):
+                regex, i = regex + re.escape(pattern[i + 1]), i + 2
+            else:
+                regex, i = regex + re.escape(pattern[i]), i + 1
+        return re.compile(regex + '$')
+
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negate = line.startswith('!')
+        line = line[negate:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        anchored = '/' in line
+        rules.append((glob_regex(line.lstrip('/')), negate, dir_only, anchored))
+
+    def ignored(path):
+        parts = path.split('/')
+        for depth in range(1, len(parts) + 1):
+            excluded = False
+            for regex, negate, dir_only, anchored in rules:
+                if dir_only and depth == len(parts):
+                    continue
+                if regex.match('/'.join(parts[:depth]) if anchored else parts[depth - 1]):
+                    excluded = not negate
+            if excluded:
+                return True
+        return False
+    return ignored
+
+def init_git(root_dir, tree, author, email, message='Initial commit', branch='main'):
+    # create a git repository whose first commit holds the rendered tree, without running git: the
+    # objects go to a single packfile straight from the contents in memory, and the index is built
+    # from a stat of the written files, so that nothing is read back and `git status` is clean
+    import hashlib
+    import struct
+    import zlib
+    git_dir = f'{root_dir}/.git'
+    if os.path.lexists(git_dir):
+        raise FileExistsError(f'{git_dir} already exists')
+    for dir_ in ('objects/info', 'objects/pack', 'refs/heads', 'refs/tags'):
+        os.makedirs(f'{git_dir}/{dir_}')
+
+    def read_static(content, expected=None):
+        # pack assets are hashed from their source, then streamed into the pack: their size comes from
+        # the opened file rather than from the pack index, and they must not change in between, so that
+        # an object header always matches its content; returns (size, mtime_ns) and the bytes in chunks
+        source = content.open()
+        stat = os.fstat(source.fileno())
+        version = (stat.st_size, stat.st_mtime_ns)
+        if expected not in (None, version):
+            source.close()
+            raise ValueError(f'{content.source} changed while it was being committed')
+        def read():
+            with source:
+                remaining = version[0]
+                while remaining:
+                    chunk = source.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        raise ValueError(f'{content.source} changed while it was being committed')
+                    remaining -= len(chunk)
+                    yield chunk
+        return version, read()
+
+    # object id -> (type code, size, content, static asset version), each object once however many paths share it
+    objects = collections.OrderedDict()
+    kinds = {1: 'commit', 2: 'tree', 3: 'blob'}
+    def add_object(code, content):
+        if isinstance(content, StaticFile):
+            version, chunks = read_static(content)
+            size = version[0]
+        else:
+            version, chunks, size = None, (content,), len(content)
+        sha = hashlib.sha1(f'{kinds[code]} {size}\0'.encode('utf-8'))
+        for chunk in chunks:
+            sha.update(chunk)
+        objects.setdefault(sha.digest(), (code, size, content, version))
+        return sha.digest()
+
+    # what `git add .` would stage: every folder holding files becomes a tree (git does not track
+    # empty folders) and the rendered .gitignore applies
+    paths = sorted(tree.files)
+    if '.gitignore' in tree.files and not isinstance(tree.files['.gitignore'], StaticFile):
+        ignored = gitignore_matcher(tree.files['.gitignore'].decode('utf-8'))
+        paths = [path for path in paths if not ignored(path)]
+    trees = collections.defaultdict(dict)
+    for path in paths:
+        parent, _, name = path.rpartition('/')
+        trees[parent][name] = add_object(3, tree.files[path])
+        while parent and parent not in trees[parent.rpartition('/')[0]]:
+            grandparent, _, name = parent.rpartition('/')
+            trees[grandparent][name] = None
+            parent = grandparent
+    # deepest folders first, entries in git order (folders sort as if their name ended with '/')
+    for dir_ in sorted(trees, key=lambda dir_: dir_.count('/') + bool(dir_), reverse=True):
+        entries = trees[dir_]
+        is_tree = lambda name: (f'{dir_}/{name}' if dir_ else name) in trees
+        payload = b''.join(
+            (b'40000 ' if is_tree(name) else b'100644 ') + name.encode('utf-8') + b'\0' + entries[name]
+            for name in sorted(entries, key=lambda name: name + '/' if is_tree(name) else name)
             )
-
-        # make project root directory
-        root_dir = f'{target_dir}/.fire-up-{project_name.replace("_","-")}'
-        if not os.path.exists(root_dir):
-            os.makedirs(root_dir)
-
-        # make project auxiliary directories
-        aux_dirs = [project_name, 'docs', 'data', 'notebooks', 'tests', 'dashboard', 'docker', 'cdk-app', 'config']
-        for dir_ in aux_dirs:
-            new_dir = f'{root_dir}/{dir_}'
-            if not os.path.exists(new_dir):
-                os.makedirs(new_dir)
-            if dir_ == 'docs':
-                os.makedirs(f'{new_dir}/css')
-                # make `project_name` dir a proper Python package
-                with open(f'{new_dir}/css/mkdocstrings.css', 'w') as file:
-                    file.write(mkdocs_css)
-                    file.close()
-            elif dir_ == 'docker':
-                os.makedirs(f'{new_dir}/dashboard')
-                # initialize Dockerfile
-                with open(f'{new_dir}/dashboard/Dockerfile', 'w') as file:
-                    file.write(dockerfile)
-                    file.close()
-            elif dir_ == 'config':
-                with open(f'{new_dir}/config.yaml', 'w') as file:
-                    file.write(
-                        format_code(
-                            f'''
-                            defaults:
-                              - animal: cane
-                            '''
-                            )
-                        )
-                    file.close()
-                os.makedirs(f'{new_dir}/animal')
-                with open(f'{new_dir}/animal/cane.yaml', 'w') as file:
-                    file.write(
-                        format_code(
-                            f'''
-                            # @package _group_
-                            nome: fido
-                            verso: bau
-                            '''
-                            )
-                        )
-                    file.close()
-                with open(f'{new_dir}/animal/gatto.yaml', 'w') as file:
-                    file.write(
-                        format_code(
-                            f'''
-                            # @package _group_
-                            nome: micio
-                            verso: miao
-                            '''
-                            )
-                        )
-                    file.close()
-            elif dir_ == 'dashboard':
-                # initialize sample Streamlit app
-                with open(f'{new_dir}/app.py', 'w') as file:
-                    file.write(streamlit_app)
-                    file.close()
-                with open(f'{new_dir}/utils.py', 'w') as file:
-                    file.close()
-                for dashboard_aux_dir in ['assets', 'components']:
-                    dashboard_subdir = f'{new_dir}/{dashboard_aux_dir}'
-                    if not os.path.exists(dashboard_subdir):
-                        os.makedirs(dashboard_subdir)
-            elif dir_ == 'tests':
-                with open(f'{new_dir}/test_pytest.py', 'w') as file:
-                    file.write(test_pytest)
-                    file.close()
-                with open(f'{new_dir}/test_loguru.py', 'w') as file:
-                    file.write(test_loguru)
-                    file.close()
-
-        # make `project_name` dir a proper Python package
-        with open(f'{root_dir}/{project_name}/__init__.py', 'w') as file:
-            file.write(package_init)
-            file.close()
-
-        # make project main directories
-        main_dirs = ['core', 'utils']
-        for dir_ in main_dirs:
-            new_dir = f'{root_dir}/{project_name}/{dir_}'
-            if not os.path.exists(new_dir):
-                os.makedirs(new_dir)
-            with open(f'{new_dir}/__init__.py', 'w') as file:
-                file.close()
-
-        # initialize README.md
-        with open(f'{root_dir}/README.md', 'w', encoding="utf-8") as file:
-            file.write(readme)
-            file.close()
-
-        # initialize .env
-        with open(f'{root_dir}/.env', 'w', encoding="utf-8") as file:
-            file.write(dotenv)
-            file.close()
-
-        # initialize setup.py
-        with open(f'{root_dir}/setup.py', 'w') as file:
-            file.write(setup)
-            file.close()
-
-        # initialize requirements.txt
-        with open(f'{root_dir}/requirements.txt', 'w') as file:
-            file.write(requirements)
-            file.close()
-
-        # initialize .gitignore
-        with open(f'{root_dir}/.gitignore', 'w') as file:
-            file.write(gitignore)
-            file.close()
-
-        # initialize Dockerfile
-        with open(f'{root_dir}/docker-compose.yml', 'w') as file:
-            file.write(docker_compose)
-            file.close()
-
-        # initialize .dockerignore
-        with open(f'{root_dir}/.dockerignore', 'w') as file:
-            file.write(dockerignore)
-            file.close()
-
-        # initialize mkdocs.yml
-        with open(f'{root_dir}/mkdocs.yml', 'w') as file:
-            file.write(mkdocs_config)
-            file.close()
-
-        # initialize project Makefile
-        with open(f'{root_dir}/Makefile', 'w') as file:
-            file.write(makefile)
-            file.close()
-
-        # initialize project make config
-        with open(f'{root_dir}/config.mk', 'w') as file:
-            file.write(make_config)
-            file.close()
-
-        # initialize sample notebook
-        with open(f'{root_dir}/notebooks/{today}_notebook.ipynb', 'w') as file:
-            file.write(jupyter_notebook)
-            file.close()
-
-        # initialize docs index
-        with open(f'{root_dir}/docs/index.md', 'w') as file:
-            file.write(f'# Welcome to {project_name_str} documentation\n')
-            file.close()
-
-@click.command()
+        sha = add_object(2, payload)
+        if dir_:
+            parent, _, name = dir_.rpartition('/')
+            trees[parent][name] = sha
+    offset = time.localtime().tm_gmtoff
+    identity = f'{author} <{email}> {int(time.time())} {"-" if offset < 0 else "+"}{abs(offset) // 3600:02d}{abs(offset) // 60 % 60:02d}'
+    commit = add_object(1, f'tree {sha.hex()}\nauthor {identity}\ncommitter {identity}\n\n{message}\n'.encode('utf-8'))
+
+    # version 2 packfile of undeltified objects: type and size header, then the zlib stream of the content
+    pack_hash = hashlib.sha1()
+    records = []
+    partial = f'{git_dir}/objects/pack/tmp_pack_{os.getpid()}'
+    with open(partial, 'wb') as pack:
+        def emit(data, crc=0):
+            pack.write(data)
+            pack_hash.update(data)
+            return zlib.crc32(data, crc)
+
+        emit(b'PACK' + struct.pack('>II', 2, len(objects)))
+        for sha, (code, size, content, version) in objects.items():
+            header = bytearray([code << 4 | size & 0x0f])
+            size >>= 4
+            while size:
+                header[-1] |= 0x80
+                header.append(size & 0x7f)
+                size >>= 7
+            offset = pack.tell()
+            crc = emit(bytes(header))
+            compressor = zlib.compressobj(1)
+            for chunk in read_static(content, version)[1] if version else (content,):
+                crc = emit(compressor.compress(chunk), crc)
+            crc = emit(compressor.flush(), crc)
+            records.append((sha, crc, offset))
+        checksum = pack_hash.digest()
+        pack.write(checksum)
+
+    # version 2 pack index: fan-out table, sorted names, CRCs and offsets (64-bit ones in a last table)
+    records.sort()
+    fanout = [0] * 256
+    for sha, _, _ in records:
+        fanout[sha[0]] += 1
+    for i in range(1, 256):
+        fanout[i] += fanout[i - 1]
+    large_offsets = [offset for _, _, offset in records if offset >= 0x80000000]
+    offsets = [offset if offset < 0x80000000 else 0x80000000 | large_offsets.index(offset) for _, _, offset in records]
+    idx = b''.join([
+        b'\377tOc', struct.pack('>I', 2), struct.pack('>256I', *fanout),
+        b''.join(sha for sha, _, _ in records),
+        struct.pack(f'>{len(records)}I', *(crc for _, crc, _ in records)),
+        struct.pack(f'>{len(records)}I', *offsets),
+        struct.pack(f'>{len(large_offsets)}Q', *large_offsets),
+        checksum
+        ])
+    name = f'{git_dir}/objects/pack/pack-{checksum.hex()}'
+    with open(f'{name}.idx', 'wb') as file:
+        file.write(idx + hashlib.sha1(idx).digest())
+    os.replace(partial, f'{name}.pack')
+
+    # version 2 index, with the stat data of the files just written so that git trusts them as is
+    index = [b'DIRC' + struct.pack('>II', 2, len(paths))]
+    for path in sorted(paths, key=lambda path: path.encode('utf-8')):
+        stat = os.stat(f'{root_dir}/{path}')
+        name = path.encode('utf-8')
+        parent, _, base = path.rpartition('/')
+        entry = struct.pack(
+            '>10I20sH',
+            int(stat.st_ctime) & 0xffffffff, stat.st_ctime_ns % 1000000000,
+            int(stat.st_mtime) & 0xffffffff, stat.st_mtime_ns % 1000000000,
+            stat.st_dev & 0xffffffff, stat.st_ino & 0xffffffff, 0o100644,
+            stat.st_uid & 0xffffffff, stat.st_gid & 0xffffffff, stat.st_size & 0xffffffff,
+            trees[parent][base], min(len(name), 0xfff)
+            ) + name
+        index.append(entry + b'\0' * (8 - len(entry) % 8))
+    index = b''.join(index)
+    with open(f'{git_dir}/index', 'wb') as file:
+        file.write(index + hashlib.sha1(index).digest())
+
+    with open(f'{git_dir}/refs/heads/{branch}', 'w') as file:
+        file.write(f'{commit.hex()}\n')
+    with open(f'{git_dir}/HEAD', 'w') as file:
+        file.write(f'ref: refs/heads/{branch}\n')
+    with open(f'{git_dir}/config', 'w') as file:
+        file.write('[core]\n\trepositoryformatversion = 0\n\tfilemode = true\n\tbare = false\n\tlogallrefupdates = true\n')
+    return commit.hex()
+
+def git_commit_subprocess(root_dir, author, email, message='Initial commit'):
+    # the usual `git init && git add . && git commit`, the baseline of `init_git` in `fireup bench`
+    import subprocess
+    identity = ['-c', f'user.name={author}', '-c', f'user.email={email}', '-c', 'commit.gpgsign=false']
+    for args in (['init', '-q'], ['add', '-A'], identity + ['commit', '-q', '-m', message]):
+        subprocess.run(['git'] + args, cwd=root_dir, check=True)
+
+def time_call(func, repeat):
+    # (min, median) wall clock seconds of `repeat` calls
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[0], timings[len(timings) // 2]
+
+def run_benchmarks(repeat=20, batch_sizes=(1, 10, 100, 1000), tmpfs_dir='/dev/shm', disk_dir='.', workers=None):
+    # time rendering, generation and batches, returning a JSON serialisable dict
+    import shutil
+    import tempfile
+    import platform
+    from fire_up_templates import FireUp
+
+    arguments = dict(project_name='bench-project', author='bench', email='bench@placeholder.com')
+    results = {}
+    record = lambda name, timing, **extra: results.__setitem__(name, dict(min=timing[0], median=timing[1], **extra))
+
+    import_ms = measure_import_time()
+    results['import'] = {'min': import_ms / 1000, 'median': import_ms / 1000, 'budget': IMPORT_TIME_BUDGET_MS / 1000}
+
+    tree = FireUp(target_dir='.', render_only=True, **arguments).tree
+    results['project'] = {
+        'files': len(tree.files),
+        'dirs': len(tree.dirs) + 1,
+        'bytes': sum(map(len, tree.files.values())),
+        # one mkdir per directory plus open/write/close per file with the concurrent sink
+        'syscalls': len(tree.dirs) + 1 + 3 * len(tree.files)
+        }
+
+    record('render', time_call(lambda: FireUp(target_dir='.', render_only=True, **arguments), repeat))
+
+    targets = {'tmpfs': tmpfs_dir if tmpfs_dir and os.path.isdir(tmpfs_dir) else None, 'disk': disk_dir}
+    for label, base_dir in targets.items():
+        if base_dir is None:
+            continue
+        work_dir = tempfile.mkdtemp(prefix='fireup-bench-', dir=base_dir)
+        try:
+            for sink_name, sink_cls in (('serial', DirectorySink), ('concurrent', ConcurrentDirectorySink), ('staged', StagedSink)):
+                def generate():
+                    target_dir = tempfile.mkdtemp(dir=work_dir)
+                    FireUp(target_dir=target_dir, sink=sink_cls(target_dir), **arguments)
+                record(f'generate_{label}_{sink_name}', time_call(generate, repeat))
+            if shutil.which('git'):
+                # the initial commit alone, each run on a freshly generated project
+                commits = {
+                    'direct': lambda project: init_git(project.root_dir, project.tree, arguments['author'], arguments['email']),
+                    'subprocess': lambda project: git_commit_subprocess(project.root_dir, arguments['author'], arguments['email'])
+                    }
+                for method, commit in commits.items():
+                    projects = iter([FireUp(target_dir=tempfile.mkdtemp(dir=work_dir), **arguments) for _ in range(repeat)])
+                    record(f'git_{label}_{method}', time_call(lambda: commit(next(projects)), repeat))
+            for size in batch_sizes:
+                target_dir = tempfile.mkdtemp(dir=work_dir)
+                entries = [dict(name=f'project-{i}', directory=target_dir) for i in range(size)]
+                start = time.perf_counter()
+                failures = sum(error is not None for _, error, _, _ in run_batch(entries, workers=workers, cache=False))
+                elapsed = time.perf_counter() - start
+                record(f'batch_{label}_{size}', (elapsed, elapsed), projects_per_s=size / elapsed, failures=failures)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'fireup': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results
+        }
+
+def compare_benchmarks(current, baseline, threshold=0.2):
+    # list (name, baseline, current, ratio) for timings slower than the baseline by more than `threshold`
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline.get('results', {}).get(name)
+        if 'median' not in result or not reference or not reference.get('median'):
+            continue
+        ratio = result['median'] / reference['median']
+        if ratio > 1 + threshold:
+            regressions.append((name, reference['median'], result['median'], ratio))
+    import_time = current['results'].get('import')
+    if import_time and import_time['median'] > import_time['budget']:
+        regressions.append(('import (budget)', import_time['budget'], import_time['median'], import_time['median'] / import_time['budget']))
+    return regressions
+
+DEFAULTS = {
+    'name': 'my-project',
+    'directory': '.',
+    'author': 'myself',
+    'email': 'myself@placeholder.com'
+    }
+
+def make_sink(target_dir, jobs=None, dry_run=False, output_format='directory', output=None, tracer=None, link_mode=None, staging_dir=None, before_move=None):
+    # pick the sink matching the command line options, `staging_dir` being '' for the default one and
+    # `before_move` a hook run on the staged project
+    if dry_run:
+        return DryRunSink(target_dir)
+    if output_format != 'directory':
+        return ArchiveSink(output=output, output_format=output_format, target_dir=target_dir, tracer=tracer)
+    if staging_dir is not None:
+        return StagedSink(target_dir, staging_dir=staging_dir or None, jobs=jobs, tracer=tracer, before_move=before_move)
+    if link_mode is not None:
+        return LinkedDirectorySink(target_dir, get_blob_store(), mode=link_mode, jobs=jobs, tracer=tracer)
+    if jobs is not None:
+        return ConcurrentDirectorySink(target_dir, jobs=jobs, tracer=tracer)
+    return DirectorySink(target_dir, tracer=tracer)
+
+def staged_git(git, staging_dir, author, email):
+    # with --staged, the repository is written in the staging folder before the move, so that a failure
+    # leaves neither a project nor a partial .git behind; None when it is written after generation
+    if not git or staging_dir is None:
+        return None
+    return lambda root_dir, tree: init_git(root_dir, tree, author, email)
+
+def split_components(ctx, param, value):
+    # click callback turning `--with docker,docs` into a tuple of component names
+    if value is None:
+        return None
+    from fire_up_templates import COMPONENTS
+    names = tuple(name.strip() for name in value.split(',') if name.strip())
+    unknown = set(names).difference(COMPONENTS)
+    if unknown:
+        raise click.BadParameter(f'unknown components {", ".join(sorted(unknown))} (choose among {", ".join(COMPONENTS)})')
+    return names
+
+def select_components(with_, without):
+    # validate a --with/--without selection, turning dependency clashes into usage errors
+    from fire_up_templates import resolve_components
+    try:
+        return resolve_components(with_, without or ())
+    except ValueError as exc:
+        raise click.UsageError(str(exc))
+
+def wheelhouse_path(value):
+    # `--wheelhouse` alone selects the default wheelhouse, paths are stored absolute
+    if value is None:
+        return None
+    return os.path.abspath(value or default_wheelhouse())
+
+def pack_specs(values):
+    # check `--pack` values, storing folders as absolute paths so that `fireup update` finds them again
+    specs = []
+    for value in values:
+        try:
+            find_pack(value)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint='--pack')
+        specs.append(os.path.abspath(value) if os.path.isdir(value) else value)
+    return tuple(specs)
+
+def load_manifest(path):
+    # read a batch manifest as a list of entries with `name`, `directory`, `author` and `email` keys
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8', newline='') as file:
+        if ext == '.json':
+            import json
+            entries = json.load(file)
+        elif ext in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise click.ClickException('PyYAML is required to read YAML manifests (pip install pyyaml).')
+            entries = yaml.safe_load(file)
+        elif ext == '.csv':
+            import csv
+            entries = list(csv.DictReader(file))
+        else:
+            raise click.ClickException(f'Unsupported manifest format: {ext or path}')
+    if isinstance(entries, dict):
+        entries = entries.get('projects')
+    if not isinstance(entries, list):
+        raise click.ClickException(f'Manifest {path} must contain a list of projects.')
+    return entries
+
+def link_report(report):
+    return (
+        f"shared files: {report['reflink']} reflinked, {report['hardlink']} hardlinked, {report['copy']} copied, "
+        f"{report['bytes_saved']} bytes saved"
+        )
+
+def generate_entry(entry, jobs=None, cache=True, components=None, options=None, link_mode=None, staging_dir=None, git=False):
+    # generate a single manifest entry, returning the failure (and the link report) instead of raising it
+    from fire_up_templates import FireUp
+    start = time.perf_counter()
+    report = None
+    name = entry.get('name') if isinstance(entry, dict) else None
+    try:
+        if not name:
+            raise ValueError('missing project name')
+        directory = entry.get('directory') or DEFAULTS['directory']
+        author = entry.get('author') or DEFAULTS['author']
+        email = entry.get('email') or DEFAULTS['email']
+        write_git = staged_git(git, staging_dir, author, email)
+        sink = make_sink(directory, jobs=jobs, link_mode=link_mode, staging_dir=staging_dir, before_move=write_git)
+        project = FireUp(
+            target_dir=directory,
+            project_name=name,
+            author=author,
+            email=email,
+            sink=sink,
+            cache=get_render_cache() if cache else None,
+            components=components,
+            options=options
+        )
+        if git and write_git is None:
+            init_git(project.root_dir, project.tree, author, email)
+        error = None
+        if link_mode is not None:
+            report = sink.report
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+    return name or '<unnamed>', error, time.perf_counter() - start, report
+
+def run_batch(entries, workers=None, executor='thread', jobs=None, cache=True, components=None, options=None, link_mode=None, staging_dir=None, git=False):
+    # generate all entries in a pool, yielding (name, error, seconds, link report) as projects complete
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+    pool_cls = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    with pool_cls(max_workers=workers) as pool:
+        futures = [pool.submit(generate_entry, entry, jobs, cache, components, options, link_mode, staging_dir, git) for entry in entries]
+        for future in as_completed(futures):
+            yield future.result()
+
+# options shared by `fireup` and `fireup batch`, in help order
+GENERATION_OPTIONS = [
+    click.option(
+        '--with',
+        'with_',
+        callback=split_components,
+        help=f"Comma separated components to include (default: all of {', '.join(COMPONENT_NAMES)})."
+        ),
+    click.option(
+        '--without',
+        callback=split_components,
+        help='Comma separated components to leave out.'
+        ),
+    click.option(
+        '--docker-profile',
+        type=click.Choice(['standard', 'optimized']),
+        default='standard',
+        show_default=True,
+        help='Dockerfile flavour: optimized is a multi-stage, cache friendly build on a slim image.'
+        ),
+    click.option(
+        '--wheelhouse',
+        is_flag=False,
+        flag_value='',
+        default=None,
+        help='Make the generated Makefile install offline from this wheelhouse (the default one when no path is given).'
+        ),
+    click.option(
+        '--pack',
+        'packs',
+        multiple=True,
+        help='Template pack folder or installed package rendered on top of the built-in templates (repeatable).'
+        ),
+    click.option(
+        '--jobs',
+        type=click.IntRange(min=1),
+        default=None,
+        help='Write files concurrently with N threads per project, skipping redundant existence checks.'
+        ),
+    click.option(
+        '--link-mode',
+        type=click.Choice(['auto', 'reflink', 'hardlink']),
+        default=None,
+        help='Materialize the files shared by every project from the blob store: reflinked, hardlinked (read-only) or auto; copied when linking fails.'
+        ),
+    click.option(
+        '--staged',
+        'staging_dir',
+        is_flag=False,
+        flag_value='',
+        default=None,
+        help='Build each project in this scratch folder (tmpfs when no path is given) and move it into place in one step.'
+        ),
+    click.option(
+        '--git',
+        is_flag=True,
+        help='Initialize a git repository holding the generated files as its first commit, written without running git.'
+        ),
+    click.option(
+        '--no-cache',
+        is_flag=True,
+        help='Render every template from scratch, bypassing the render cache.'
+        )
+    ]
+
+def generation_options(command):
+    for option in reversed(GENERATION_OPTIONS):
+        command = option(command)
+    return command
+
+@click.group(invoke_without_command=True)
+@click.version_option(__version__, prog_name='FireUp')
 @click.option(
     '--name',
-    default='my-project',
-    prompt='Project name',
     help='Name for the initialized Python project (will be used for folders and other stuff).'
     )
 @click.option(
     '--directory',
-    default='.',
-    prompt='Target directory',
     help='Directory in which the project must be initialized.'
     )
 @click.option(
     '--author',
-    default='myself',
-    prompt='Author name',
     help="Project's author name."
     )
 @click.option(
     '--email',
-    default='myself@placeholder.com',
-    prompt='Author email',
     help="Project's author email."
     )
-def main(name, directory, author, email):
-    FireUp(
-        target_dir=directory,
-        project_name=name,
-        author=author,
-        email=email
+@generation_options
+@click.option(
+    '--output-format',
+    type=click.Choice(['directory', 'tar', 'tar.gz', 'zip']),
+    default='directory',
+    show_default=True,
+    help='Write the project as a folder or stream it into a single archive.'
+    )
+@click.option(
+    '--output',
+    default=None,
+    help="Archive path ('-' for stdout), defaults to the project folder name inside the target directory."
+    )
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Render the project and list the files it would create without writing anything.'
+    )
+@click.option(
+    '--profile',
+    is_flag=True,
+    help='Print the time spent in each phase and on the slowest files.'
+    )
+@click.option(
+    '--trace-json',
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help='Save per-phase and per-file timings to this file.'
+    )
+@click.option(
+    '--trace-format',
+    type=click.Choice(['chrome', 'jsonl']),
+    default='chrome',
+    show_default=True,
+    help='Chrome trace event format (chrome://tracing, Perfetto) or one JSON event per line.'
+    )
+@click.pass_context
+def main(ctx, name, directory, author, email, with_, without, docker_profile, wheelhouse, packs, jobs, link_mode, staging_dir, git, output_format, output, no_cache, dry_run, profile, trace_json, trace_format):
+    # subcommands take their own arguments, plain `fireup` keeps the interactive setup
+    if ctx.invoked_subcommand is not None:
+        return
+    from fire_up_templates import FireUp
+    components = select_components(with_, without)
+    prompt = lambda value, text, key: click.prompt(text, default=DEFAULTS[key]) if value is None else value
+    name = prompt(name, 'Project name', 'name')
+    directory = prompt(directory, 'Target directory', 'directory')
+    author = prompt(author, 'Author name', 'author')
+    email = prompt(email, 'Author email', 'email')
+    tracer = Tracer() if profile or trace_json else None
+    if link_mode is not None and output_format != 'directory':
+        raise click.UsageError('--link-mode only applies to the directory output format.')
+    if staging_dir is not None and (output_format != 'directory' or link_mode is not None):
+        raise click.UsageError('--staged only applies to the directory output format, without --link-mode.')
+    if git and (output_format != 'directory' or dry_run):
+        raise click.UsageError('--git only applies to the directory output format, without --dry-run.')
+    write_git = staged_git(git, staging_dir, author, email)
+    sink = make_sink(
+        directory,
+        jobs=jobs,
+        dry_run=dry_run,
+        output_format=output_format,
+        output=output,
+        tracer=tracer,
+        link_mode=link_mode,
+        staging_dir=staging_dir,
+        before_move=write_git
+        )
+    options = {'docker_profile': docker_profile, 'wheelhouse': wheelhouse_path(wheelhouse), 'packs': pack_specs(packs)}
+    try:
+        project = FireUp(
+            target_dir=directory,
+            project_name=name,
+            author=author,
+            email=email,
+            sink=sink,
+            cache=None if no_cache else get_render_cache(),
+            components=components,
+            tracer=tracer,
+            options=options
+        )
+        if git and write_git is None:
+            init_git(project.root_dir, project.tree, author, email)
+    except ValueError as exc:
+        # template packs using unknown variables or changed since they were indexed
+        raise click.ClickException(str(exc))
+    except FileExistsError as exc:
+        # `--staged` only creates new projects, `--git` only new repositories
+        raise click.ClickException(str(exc))
+    if trace_json:
+        tracer.dump(trace_json, trace_format=trace_format)
+    if profile:
+        click.echo(tracer.summary(), err=True)
+    if isinstance(sink, LinkedDirectorySink):
+        click.echo(link_report(sink.report))
+
+@main.command()
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of parallel workers (defaults to the executor default).'
+    )
+@click.option(
+    '--executor',
+    type=click.Choice(['thread', 'process']),
+    default='thread',
+    show_default=True,
+    help='Pool used to generate projects.'
+    )
+@generation_options
+def batch(manifest, workers, executor, with_, without, docker_profile, wheelhouse, packs, jobs, link_mode, staging_dir, git, no_cache):
+    """Generate every project listed in a YAML/JSON/CSV MANIFEST."""
+    if staging_dir is not None and link_mode is not None:
+        raise click.UsageError('--staged and --link-mode cannot be combined.')
+    components = select_components(with_, without)
+    entries = load_manifest(manifest)
+    failures = 0
+    links = collections.Counter()
+    start = time.perf_counter()
+    for name, error, elapsed, report in run_batch(
+        entries,
+        workers=workers,
+        executor=executor,
+        jobs=jobs,
+        cache=not no_cache,
+        components=components,
+        options={'docker_profile': docker_profile, 'wheelhouse': wheelhouse_path(wheelhouse), 'packs': pack_specs(packs)},
+        link_mode=link_mode,
+        staging_dir=staging_dir,
+        git=git
+        ):
+        links.update(report or {})
+        if error is None:
+            click.echo(f'[ok]     {name} ({elapsed:.3f}s)')
+        else:
+            failures += 1
+            click.echo(f'[failed] {name}: {error}', err=True)
+    elapsed = time.perf_counter() - start
+    throughput = len(entries) / elapsed if elapsed > 0 else float('inf')
+    click.echo(
+        f'{len(entries) - failures}/{len(entries)} projects generated in {elapsed:.2f}s '
+        f'({throughput:.1f} projects/s)'
+        )
+    if link_mode is not None:
+        click.echo(link_report(links))
+    if failures:
+        sys.exit(1)
+
+@main.command()
+@click.argument('project_dirs', nargs=-1, required=True, type=click.Path(exists=True, file_okay=False))
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of threads used to hash existing files.'
+    )
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Overwrite files edited by the user when their template changed.'
+    )
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Only report what would be updated.'
+    )
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Render every template from scratch, bypassing the render cache.'
+    )
+def update(project_dirs, jobs, force, dry_run, no_cache):
+    """Re-apply the current templates to projects generated by FireUp."""
+    conflicts = 0
+    for project_dir in project_dirs:
+        report = update_project(
+            project_dir,
+            jobs=jobs,
+            cache=None if no_cache else get_render_cache(),
+            force=force,
+            dry_run=dry_run
+            )
+        for status in ('updated', 'created', 'conflicts', 'stale'):
+            for path in report[status]:
+                click.echo(f'[{status}] {project_dir}/{path}')
+        conflicts += len(report['conflicts'])
+        click.echo(
+            f"{project_dir}: {len(report['updated'])} updated, {len(report['created'])} created, "
+            f"{len(report['unchanged'])} unchanged, {len(report['conflicts'])} conflicts, {len(report['stale'])} stale"
+            )
+    if conflicts:
+        sys.exit(1)
+
+@main.command()
+@click.option(
+    '--repeat',
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help='Repetitions of the render and single generation timings.'
+    )
+@click.option(
+    '--batch-sizes',
+    default='1,10,100,1000',
+    show_default=True,
+    help='Comma separated numbers of projects generated by the batch timings.'
+    )
+@click.option(
+    '--tmpfs-dir',
+    default='/dev/shm',
+    show_default=True,
+    help='Memory backed directory for the tmpfs timings (skipped if missing).'
+    )
+@click.option(
+    '--disk-dir',
+    default='.',
+    show_default=True,
+    help='Directory on a regular disk for the disk timings.'
+    )
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of parallel workers for the batch timings.'
+    )
+@click.option(
+    '--output',
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help='Save the results as JSON.'
+    )
+@click.option(
+    '--compare',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Baseline JSON results to check for regressions.'
+    )
+@click.option(
+    '--threshold',
+    type=click.FloatRange(min=0),
+    default=0.2,
+    show_default=True,
+    help='Relative slowdown over the baseline reported as a regression.'
+    )
+def bench(repeat, batch_sizes, tmpfs_dir, disk_dir, workers, output, compare, threshold):
+    """Benchmark project rendering and generation."""
+    import json
+    try:
+        batch_sizes = tuple(int(size) for size in batch_sizes.split(',') if size.strip())
+    except ValueError:
+        raise click.BadParameter('expected comma separated integers', param_hint='--batch-sizes')
+    results = run_benchmarks(
+        repeat=repeat,
+        batch_sizes=batch_sizes,
+        tmpfs_dir=tmpfs_dir,
+        disk_dir=disk_dir,
+        workers=workers
+        )
+    project = results['results'].pop('project')
+    click.echo(f"{'benchmark':<32}{'min (ms)':>12}{'median (ms)':>14}")
+    for name, result in results['results'].items():
+        extra = f"  {result['projects_per_s']:.1f} projects/s" if 'projects_per_s' in result else ''
+        click.echo(f"{name:<32}{result['min'] * 1000:>12.3f}{result['median'] * 1000:>14.3f}{extra}")
+    click.echo(f"per project: {project['files']} files, {project['dirs']} dirs, {project['bytes']} bytes, ~{project['syscalls']} syscalls")
+    results['results']['project'] = project
+    if output:
+        with open(output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if compare:
+        with open(compare) as file:
+            baseline = json.load(file)
+        regressions = compare_benchmarks(results, baseline, threshold=threshold)
+        for name, reference, current, ratio in regressions:
+            click.echo(f'[regression] {name}: {reference * 1000:.3f}ms -> {current * 1000:.3f}ms ({ratio:.2f}x)', err=True)
+        if regressions:
+            sys.exit(1)
+        click.echo(f'No regressions against {compare} (threshold {threshold:.0%})')
+
+@main.group()
+def wheelhouse():
+    """Manage the local wheelhouse used for offline installs."""
+
+@wheelhouse.command('build')
+@click.option(
+    '--dir',
+    'wheelhouse_dir',
+    default=None,
+    help='Wheelhouse folder (defaults to $FIREUP_WHEELHOUSE or ~/.cache/fireup/wheelhouse).'
+    )
+@click.option(
+    '--with',
+    'with_',
+    callback=split_components,
+    help='Comma separated components whose dependencies are included (default: all).'
+    )
+@click.option(
+    '--without',
+    callback=split_components,
+    help='Comma separated components whose dependencies are left out.'
+    )
+@click.option(
+    '--python',
+    default=None,
+    help='Interpreter the wheels are built for, it should match the one of the generated environments.'
+    )
+def wheelhouse_build(wheelhouse_dir, with_, without, python):
+    """Download and build wheels for every dependency of generated projects."""
+    import subprocess
+    wheelhouse_dir = wheelhouse_path(wheelhouse_dir or '')
+    try:
+        wheels = build_wheelhouse(wheelhouse_dir, components=select_components(with_, without), python=python)
+    except subprocess.CalledProcessError as exc:
+        raise click.ClickException(f'pip wheel failed with exit code {exc.returncode}')
+    click.echo(f'{len(wheels)} wheels in {wheelhouse_dir}')
+    click.echo(f'Generate projects with `fireup --wheelhouse {wheelhouse_dir}` to install from it.')
+
+@main.group()
+def pack():
+    """Index and inspect template packs."""
+
+@pack.command('index')
+@click.argument('pack_dir', type=click.Path(exists=True, file_okay=False))
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of threads used to hash the pack files.'
     )
+def pack_index(pack_dir, jobs):
+    """Write the index of a template pack folder, to run again whenever the pack changes."""
+    import json
+    try:
+        index = build_pack_index(pack_dir, jobs=jobs)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+    with open(os.path.join(pack_dir, PACK_INDEX), 'w', encoding='utf-8') as file:
+        json.dump(index, file, indent=2)
+    templates = sum(entry['template'] for entry in index['files'])
+    click.echo(f"{len(index['files'])} files ({templates} templates) indexed in {os.path.join(pack_dir, PACK_INDEX)}")
+
+@pack.command('show')
+@click.argument('spec')
+def pack_show(spec):
+    """List the files of a template pack (folder or installed package) by component."""
+    try:
+        template_pack = load_pack(spec)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+    click.echo(f'pack: {template_pack.root}')
+    for entry in template_pack.index['files']:
+        kind = f"template ({', '.join(entry['variables']) or 'no variables'})" if entry['template'] else f"static, {entry['size']} bytes"
+        click.echo(f"[{entry['component']}] {entry['path']}: {kind}")
+
+@main.group()
+def store():
+    """Inspect or empty the blob store of files shared by generated projects."""
+
+@store.command('stats')
+def store_stats():
+    """Show blob store location and size."""
+    stats = get_blob_store().stats()
+    click.echo(f"path:    {stats['path']}")
+    click.echo(f"entries: {stats['entries']}")
+    click.echo(f"bytes:   {stats['bytes']}")
+
+@store.command('clear')
+def store_clear():
+    """Remove every blob: hardlinked project files keep their content, new projects store it again."""
+    blob_store = get_blob_store()
+    blob_store.clear()
+    click.echo(f'Cleared {blob_store.path}')
+
+@main.group()
+def cache():
+    """Inspect or empty the persistent render cache."""
+
+@cache.command('stats')
+def cache_stats():
+    """Show render cache location, size and hit rate."""
+    stats = get_render_cache().stats()
+    lookups = stats['hits'] + stats['misses']
+    click.echo(f"path:    {stats['path']}")
+    click.echo(f"entries: {stats['entries']}")
+    click.echo(f"bytes:   {stats['bytes']} / {stats['max_bytes']}")
+    click.echo(f"hits:    {stats['hits']}")
+    click.echo(f"misses:  {stats['misses']}")
+    click.echo(f"hit rate: {stats['hits'] / lookups:.1%}" if lookups else 'hit rate: n/a')
+
+@cache.command('clear')
+def cache_clear():
+    """Remove every cached render and reset the statistics."""
+    render_cache = get_render_cache()
+    render_cache.clear()
+    click.echo(f"Cleared {os.path.join(render_cache.path, 'renders')}")
 
 if __name__ == '__main__':
+    # run the `fire_up` module rather than this `__main__` copy, which `fire_up_templates` would not share
+    from fire_up import main
     main()
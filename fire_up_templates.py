@@ -0,0 +1,2198 @@
+# -*- coding: utf-8 -*-
+
+# the project templates and the component registry, imported by `fire_up` only when a project is
+# rendered, so that its command line (`--help`, `--version`, the cache, store and pack commands)
+# never loads them
+
+import collections
+
+from fire_up import MANIFEST, DirectorySink, RenderedTree, StaticFile, content_hash, load_pack, render_template, trace
+
+Component = collections.namedtuple('Component', ['name', 'requires', 'help', 'render'])
+
+# optional project components, in the order they are rendered; the core project is always rendered
+COMPONENTS = collections.OrderedDict()
+
+def component(name, requires=(), help=''):
+    # register a FireUp render method as an optional component returning (dirs, files)
+    def register(method):
+        COMPONENTS[name] = Component(name, tuple(requires), help, method)
+        return method
+    return register
+
+def resolve_components(selected=None, excluded=()):
+    # expand a feature selection with the components it depends on, in registry order
+    unknown = set(selected or ()).union(excluded).difference(COMPONENTS)
+    if unknown:
+        raise ValueError(f'Unknown components: {", ".join(sorted(unknown))} (choose among {", ".join(COMPONENTS)})')
+    selected = set(COMPONENTS if selected is None else selected).difference(excluded)
+    pending = list(selected)
+    while pending:
+        name = pending.pop()
+        for dependency in COMPONENTS[name].requires:
+            if dependency in excluded:
+                raise ValueError(f"Component '{name}' requires '{dependency}', which has been excluded")
+            if dependency not in selected:
+                selected.add(dependency)
+                pending.append(dependency)
+    return tuple(name for name in COMPONENTS if name in selected)
+
+# rendering options beyond the project identity and components, with their defaults
+OPTIONS = {
+    'docker_profile': 'standard',
+    'wheelhouse': None,
+    'packs': ()
+    }
+
+# dependency groups of generated projects as (group, component, packages): `runtime` becomes
+# install_requires and every other group an extra of the same name
+REQUIREMENT_GROUPS = [
+    ('runtime', None, ['python-dotenv', 'loguru', 'click', 'pydantic']),
+    ('runtime', 'hydra', ['hydra-core']),
+    ('dashboard', 'dashboard', ['streamlit>=1.18']),
+    ('docs', 'docs', ['mkdocs', 'mkdocs-material', 'mkdocstrings']),
+    ('aws', 'cdk', ['boto3']),
+    ('data', None, ['pyarrow']),
+    ('dev', None, ['pipreqs', 'pytest', 'pytest-html', 'pytest-xdist', 'pytest-benchmark', 'pylint', 'mypy']),
+    ('dev', 'notebooks', ['ipykernel'])
+    ]
+
+def requirement_groups(components):
+    # packages of each non-empty group for the selected components
+    groups = collections.OrderedDict()
+    for group, name, packages in REQUIREMENT_GROUPS:
+        if name is None or name in components:
+            groups.setdefault(group, []).extend(packages)
+    return groups
+
+# built-in templates rendered the same for every project and not meant to be edited in place, linked from
+# the blob store with `--link-mode` along with empty modules and template pack assets
+SHARED_TEMPLATES = frozenset(['docs/css/mkdocstrings.css', 'tests/test_pytest.py', 'tests/test_loguru.py'])
+
+class FireUp:
+
+    def __init__(
+        self,
+        target_dir,
+        project_name,
+        author,
+        email,
+        sink=None,
+        render_only=False,
+        cache=None,
+        components=None,
+        tracer=None,
+        options=None
+        ):
+
+        self.target_dir = target_dir
+        self.project_name = project_name.replace(' ', '_').replace('-', '_')
+        self.author = author
+        self.email = email
+        self.cache = cache
+        self.tracer = tracer
+        self.components = resolve_components(components)
+        unknown = set(options or ()).difference(OPTIONS)
+        if unknown:
+            raise ValueError(f'Unknown options: {", ".join(sorted(unknown))}')
+        self.options = dict(OPTIONS, **(options or {}))
+
+        self.project_name_str = ''.join(list(map(lambda x: x.capitalize(), f'{self.project_name}'.split('_'))))
+        self.project_env = f'.venv-{self.project_name.replace("_","-")}'
+
+        # templates are plain `str.format` strings, rendered (or served from the cache) against these variables
+        import datetime
+        self.context = {
+            'project_name': self.project_name,
+            'project_name_str': self.project_name_str,
+            'project_env': self.project_env,
+            'author': author,
+            'email': email,
+            'today': str(datetime.datetime.now().date()).replace('-','')
+            }
+
+        # phase one: render every template in memory
+        with trace(tracer, 'render'):
+            self.tree = self.render()
+
+        # phase two: flush the rendered tree through a sink (on disk by default)
+        self.root_dir = None
+        if not render_only:
+            self.root_dir = self.write(sink or DirectorySink(target_dir, tracer=tracer))
+
+    def write(self, sink):
+        with trace(self.tracer, 'write'):
+            if getattr(sink, 'links_shared_files', False):
+                return sink.write(self.tree, shared=self.shared_paths())
+            return sink.write(self.tree)
+
+    def shared_paths(self):
+        # an allow-list rather than every file that happens not to depend on the project: linked files share
+        # their inode across projects, so configuration, requirements or helpers users edit are never linked
+        return frozenset(
+            path for path, content in self.tree.files.items()
+            if isinstance(content, StaticFile) or self.tree.templates.get(path) in SHARED_TEMPLATES
+            or (content == b'' and path.rsplit('/', 1)[-1] == '__init__.py')
+            )
+
+    def render_template(self, template, **context):
+        return render_template(template, dict(self.context, **context), cache=self.cache)
+
+    def render(self):
+        import types
+
+        # unselected components are never rendered
+        with trace(self.tracer, 'render core'):
+            dirs, files = self.render_core()
+        for name in self.components:
+            with trace(self.tracer, f'render {name}'):
+                component_dirs, component_files = COMPONENTS[name].render(self)
+            dirs += component_dirs
+            files.update(component_files)
+
+        # template packs come last, so that their files replace the built-in ones at the same path
+        for spec in self.options['packs']:
+            with trace(self.tracer, f'render pack {spec}'):
+                pack_dirs, pack_files = load_pack(spec).render(self)
+            dirs += pack_dirs
+            files.update(pack_files)
+        dirs = list(dict.fromkeys(dirs))
+
+        # paths are declared as templates too, their unformatted form identifies the file across runs
+        format_path = lambda path: path.format(**self.context)
+        templates = {format_path(template): template for template in files}
+        files = {format_path(template): content for template, content in files.items()}
+        with trace(self.tracer, 'render manifest'):
+            files[MANIFEST] = self.render_manifest(files, templates)
+
+        return RenderedTree(
+            root=f'.fire-up-{self.project_name.replace("_","-")}',
+            dirs=tuple(map(format_path, dirs)),
+            files=types.MappingProxyType(files),
+            templates=types.MappingProxyType(templates)
+            )
+
+    def render_manifest(self, files, templates):
+        import json
+        manifest = {
+            'name': self.project_name,
+            'author': self.author,
+            'email': self.email,
+            'components': list(self.components),
+            'options': self.options,
+            'files': [
+                {'path': path, 'template': templates[path], 'hash': content_hash(content)}
+                for path, content in files.items()
+                ]
+            }
+        return json.dumps(manifest, indent=2).encode('utf-8')
+
+    def render_core(self):
+
+        components = self.components
+
+        import textwrap
+        format_code = lambda x: textwrap.dedent(x).strip()
+
+        groups = requirement_groups(components)
+        extras = [group for group in groups if group != 'runtime']
+
+        # requirements.txt keeps installing the whole development environment
+        requirements = format_code('\n'.join(f'-r requirements/{group}.txt' for group in groups)).encode('utf-8')
+
+        # README project tree, one block (entry plus trailing separator) per optional entry
+        tree = [
+            (None, '├── {project_env}/\n│'),
+            (None, '├── benchmarks/\n│'),
+            ('cdk', '├── cdk-app/\n|'),
+            ('hydra', '├── config/\n│'),
+            ('dashboard', format_code(
+                '''
+                ├── dashboard/
+                |   |
+                │   ├── assets/
+                |   |
+                │   ├── components/
+                │   |   ├── __init__.py
+                │   |   ├── data.py
+                │   |   └── resources.py
+                |   |
+                │   ├── app.py
+                |   |
+                │   └── utils.py
+                │
+                '''
+                )),
+            (None, '├── data/\n│'),
+            ('docker', format_code(
+                '''
+                ├── docker/
+                |   |
+                │   └── dashboard/
+                |       |
+                │       └── Dockerfile
+                |
+                '''
+                )),
+            ('docs', format_code(
+                '''
+                ├── docs/
+                |   |
+                │   ├── css/
+                │   |   └── mkdocstrings.css
+                |   |
+                │   └── index.md
+                |
+                '''
+                )),
+            ('notebooks', '├── notebooks/\n│'),
+            (None, '├── requirements/\n│'),
+            (None, '├── tests/\n|'),
+            (None, format_code(
+                '''
+                ├── {project_name}/
+                |   |
+                |   ├── __init__.py
+                │   │
+                |   ├── core/
+                │   |   └── __init__.py
+                │   │
+                |   ├── io/
+                │   |   ├── __init__.py
+                │   |   └── __main__.py
+                │   │
+                |   └── utils/
+                │       ├── __init__.py
+                │       ├── logging.py
+                │       └── profiling.py
+                |
+                '''
+                )),
+            ('docker', '├── .dockerignore'),
+            (None, '├── .env'),
+            (None, '├── .gitignore'),
+            (None, '├── config.mk'),
+            ('docker', '├── docker-compoe.yml'),
+            (None, '├── Makefile'),
+            ('docs', '├── mkdocs.yml'),
+            (None, '├── README.md'),
+            (None, '├── requirements.txt'),
+            (None, '└── setup.py')
+            ]
+        project_tree = '\n'.join(['root/', '│'] + [block for name, block in tree if name is None or name in components])
+
+        readme = [
+            self.render_template(
+                '''
+                # {project_name_str}
+
+                {project_name_str} is a Python package initialized with FireUp!
+
+                ## Installation
+
+                Use the package manager [pip](https://pip.pypa.io/en/stable/) to install {project_name} in edit mode.
+
+                ```python
+                >>> pip install -e . # in the root folder (look for setup.py)
+                ```
+
+                ## Project tree structure
+
+                ```python
+                {project_tree}
+                ```
+                ''',
+                project_tree=project_tree.format(**self.context)
+                )
+            ]
+        if 'dashboard' in components:
+            readme.append(self.render_template(
+                '''
+                ## Usage
+
+                Install [streamlit](https://docs.streamlit.io/) via `pip` and execute the following in the root folder to run Streamlit sample app (by default on port 8501)
+
+                ```python
+                >>> cd ./dashboard
+                >>> streamlit run app.py
+                ```
+                '''
+                ))
+        readme.append(self.render_template(
+            '''
+            ## Authors
+
+            - **{author}**
+            '''
+            ))
+        readme = b'\n\n'.join(readme)
+
+        setup = self.render_template(
+            '''
+            """A setuptools based setup module.
+            See:
+            https://packaging.python.org/guides/distributing-packages-using-setuptools/
+            https://github.com/pypa/sampleproject
+            """
+
+            # Always prefer setuptools over distutils
+            from setuptools import setup, find_packages # type: ignore
+            from os import path
+
+            def read_requirements(group):
+                with open(path.join('requirements', f'{{group}}.txt')) as f:
+                    return [line for line in f.read().splitlines() if line and not line.startswith('#')]
+
+            requirements = read_requirements('runtime')
+            extras = {{group: read_requirements(group) for group in {extras}}}
+
+            # Arguments marked as "Required" below must be included for upload to PyPI.
+            # Fields marked as "Optional" may be commented out.
+
+            setup(
+                # This is the name of your project. The first time you publish this
+                # package, this name will be registered for you. It will determine how
+                # users can install this project, e.g.:
+                #
+                # $ pip install sampleproject
+                #
+                # And where it will live on PyPI: https://pypi.org/project/sampleproject/
+                #
+                # There are some restrictions on what makes a valid project name
+                # specification here:
+                # https://packaging.python.org/specifications/core-metadata/#name
+                name='{project_name}',  # Required
+
+                # Versions should comply with PEP 440:
+                # https://www.python.org/dev/peps/pep-0440/
+                #
+                # For a discussion on single-sourcing the version across setup.py and the
+                # project code, see
+                # https://packaging.python.org/en/latest/single_source_version.html
+                version='1.0.0',  # Required
+
+                # This is a one-line description or tagline of what your project does. This
+                # corresponds to the "Summary" metadata field:
+                # https://packaging.python.org/specifications/core-metadata/#summary
+                description='{project_name_str}',  # Optional
+
+                # This should be your name or the name of the organization which owns the
+                # project.
+                author='{author}',  # Optional
+
+                # This should be a valid email address corresponding to the author listed
+                # above.
+                author_email='{email}',  # Optional
+
+                # This field adds keywords for your project which will appear on the
+                # project page. What does your project relate to?
+                #
+                # Note that this is a string of words separated by whitespace, not a list.
+                keywords='sample setuptools development',  # Optional
+
+                # When your source code is in a subdirectory under the project root, e.g.
+                # `src/`, it is necessary to specify the `package_dir` argument.
+                # package_dir={{'': '{project_name}'}},  # Optional
+
+                # You can just specify package directories manually here if your project is
+                # simple. Or you can use find_packages().
+                #
+                # Alternatively, if you just want to distribute a single Python file, use
+                # the `py_modules` argument instead as follows, which will expect a file
+                # called `my_module.py` to exist:
+                #
+                #   py_modules=["my_module"],
+                #
+                packages=find_packages(exclude=['data', 'docs', '{project_env}', 'notebooks']),  # Required
+
+                # Specify which Python versions you support. In contrast to the
+                # 'Programming Language' classifiers above, 'pip install' will check this
+                # and refuse to install the project if the version does not match. If you
+                # do not support Python 2, you can simplify this to '>=3.5' or similar, see
+                # https://packaging.python.org/guides/distributing-packages-using-setuptools/#python-requires
+                python_requires='>=3.6',
+
+                # This field lists other packages that your project depends on to run.
+                # Any package you put here will be installed by pip when your project is
+                # installed, so they must be valid existing projects.
+                #
+                # For an analysis of "install_requires" vs pip's requirements files see:
+                # https://packaging.python.org/en/latest/requirements.html
+                install_requires=requirements,  # Optional
+
+                # List additional groups of dependencies here (e.g. development
+                # dependencies). Users will be able to install these using the "extras"
+                # syntax, for example:
+                #
+                #   $ pip install {project_name}[dev]
+                #
+                # Each group is read from the matching file in the requirements/ folder.
+                extras_require=extras,  # Optional
+            )
+            ''',
+            extras=repr(extras)
+            )
+
+        gitignore = self.render_template(
+            '''
+
+            # Created by https://www.gitignore.io/api/osx,linux,python,windows,pycharm,visualstudiocode
+
+            ### Linux ###
+            *~
+
+            # temporary files which can be created if a process still has a handle open of a deleted file
+            .fuse_hidden*
+
+            # KDE directory preferences
+            .directory
+
+            # Linux trash folder which might appear on any partition or disk
+            .Trash-*
+
+            # .nfs files are created when an open file is removed but is still being accessed
+            .nfs*
+
+            ### OSX ###
+            *.DS_Store
+            .AppleDouble
+            .LSOverride
+
+            # Icon must end with two \r
+            Icon
+
+            # Thumbnails
+            ._*
+
+            # Files that might appear in the root of a volume
+            .DocumentRevisions-V100
+            .fseventsd
+            .Spotlight-V100
+            .TemporaryItems
+            .Trashes
+            .VolumeIcon.icns
+            .com.apple.timemachine.donotpresent
+
+            # Directories potentially created on remote AFP share
+            .AppleDB
+            .AppleDesktop
+            Network Trash Folder
+            Temporary Items
+            .apdisk
+
+            ### PyCharm ###
+            # Covers JetBrains IDEs: IntelliJ, RubyMine, PhpStorm, AppCode, PyCharm, CLion, Android Studio and Webstorm
+            # Reference: https://intellij-support.jetbrains.com/hc/en-us/articles/206544839
+
+            # User-specific stuff:
+            .idea/**/workspace.xml
+            .idea/**/tasks.xml
+            .idea/dictionaries
+
+            # Sensitive or high-churn files:
+            .idea/**/dataSources/
+            .idea/**/dataSources.ids
+            .idea/**/dataSources.xml
+            .idea/**/dataSources.local.xml
+            .idea/**/sqlDataSources.xml
+            .idea/**/dynamic.xml
+            .idea/**/uiDesigner.xml
+
+            # Gradle:
+            .idea/**/gradle.xml
+            .idea/**/libraries
+
+            # CMake
+            cmake-build-debug/
+
+            # Mongo Explorer plugin:
+            .idea/**/mongoSettings.xml
+
+            ## File-based project format:
+            *.iws
+
+            ## Plugin-specific files:
+
+            # IntelliJ
+            /out/
+
+            # mpeltonen/sbt-idea plugin
+            .idea_modules/
+
+            # JIRA plugin
+            atlassian-ide-plugin.xml
+
+            # Cursive Clojure plugin
+            .idea/replstate.xml
+
+            # Ruby plugin and RubyMine
+            /.rakeTasks
+
+            # Crashlytics plugin (for Android Studio and IntelliJ)
+            com_crashlytics_export_strings.xml
+            crashlytics.properties
+            crashlytics-build.properties
+            fabric.properties
+
+            ### PyCharm Patch ###
+            # Comment Reason: https://github.com/joeblau/gitignore.io/issues/186#issuecomment-215987721
+
+            # *.iml
+            # modules.xml
+            # .idea/misc.xml
+            # *.ipr
+
+            # Sonarlint plugin
+            .idea/sonarlint
+
+            ### Python ###
+            # Byte-compiled / optimized / DLL files
+            __pycache__/
+            *.py[cod]
+            *$py.class
+
+            # C extensions
+            *.so
+
+            # Distribution / packaging
+            .Python
+            build/
+            develop-eggs/
+            dist/
+            downloads/
+            eggs/
+            .eggs/
+            lib/
+            lib64/
+            parts/
+            sdist/
+            var/
+            wheels/
+            *.egg-info/
+            .installed.cfg
+            *.egg
+
+            # PyInstaller
+            #  Usually these files are written by a python script from a template
+            #  before PyInstaller builds the exe, so as to inject date/other infos into it.
+            *.manifest
+            *.spec
+
+            # Installer logs
+            pip-log.txt
+            pip-delete-this-directory.txt
+
+            # Unit test / coverage reports
+            htmlcov/
+            .tox/
+            .coverage
+            .coverage.*
+            .cache
+            .pytest_cache/
+            nosetests.xml
+            coverage.xml
+            *.cover
+            .hypothesis/
+
+            # Translations
+            *.mo
+            *.pot
+
+            # Flask stuff:
+            instance/
+            .webassets-cache
+
+            # Scrapy stuff:
+            .scrapy
+
+            # Sphinx documentation
+            docs/_build/
+            autoapi
+
+            # mkdocs docs
+            site/
+
+            # PyBuilder
+            target/
+
+            # Jupyter Notebook
+            .ipynb_checkpoints
+            *.ipynb*
+
+            # pyenv
+            .python-version
+
+            # celery beat schedule file
+            celerybeat-schedule.*
+
+            # SageMath parsed files
+            *.sage.py
+
+            # Environments
+            .venv
+            env/
+            venv/
+            ENV/
+            env.bak/
+            venv.bak/
+            {project_env}
+
+            # Spyder project settings
+            .spyderproject
+            .spyproject
+
+            # Rope project settings
+            .ropeproject
+
+            # mkdocs documentation
+            /site
+
+            # mypy
+            .mypy_cache/
+
+            ### VisualStudioCode ###
+            .vscode/*
+            !.vscode/settings.json
+            !.vscode/tasks.json
+            !.vscode/launch.json
+            !.vscode/extensions.json
+            .history
+
+            ### Windows ###
+            # Windows thumbnail cache files
+            Thumbs.db
+            ehthumbs.db
+            ehthumbs_vista.db
+
+            # Folder config file
+            Desktop.ini
+
+            # Recycle Bin used on file shares
+            $RECYCLE.BIN/
+
+            # Windows Installer files
+            *.cab
+            *.msi
+            *.msm
+            *.msp
+
+            # Windows shortcuts
+            *.lnk
+
+            # Build folder
+
+            */build/*
+
+            # Chalice build
+            .chalice/deployments/
+
+            # charts
+            *.pdf
+            *.pptx
+
+            # text documents
+            *.doc
+            *.docx
+
+            # xlsx and csv
+            *.xls
+            *.xlsx
+            *.csv
+
+            # JPEG
+            *.jpg
+            *.jpeg
+            *.jpe
+            *.jif
+            *.jfif
+            *.jfi
+
+            # JPEG 2000
+            *.jp2
+            *.j2k
+            *.jpf
+            *.jpx
+            *.jpm
+            *.mj2
+
+            # JPEG XR
+            *.jxr
+            *.hdp
+            *.wdp
+
+            # Graphics Interchange Format
+            *.gif
+
+            # RAW
+            *.raw
+
+            # Web P
+            *.webp
+
+            # Portable Network Graphics
+            *.png
+
+            # Animated Portable Network Graphics
+            *.apng
+
+            # Multiple-image Network Graphics
+            *.mng
+
+            # Tagged Image File Format
+            *.tiff
+            *.tif
+
+            # Scalable Vector Graphics
+            *.svg
+            *.svgz
+
+            # Portable Document Format
+            *.pdf
+
+            # X BitMap
+            *.xbm
+
+            # BMP
+            *.bmp
+            *.dib
+
+            # data
+            /data/
+
+            # benchmark results (the baseline is versioned)
+            /benchmarks/results.json
+
+            # profiling reports
+            /profiles/
+
+            # log files
+            /logs/
+
+            # End of https://www.gitignore.io/api/osx,linux,python,windows,pycharm,visualstudiocode
+            '''
+            )
+
+        make_targets = [
+            (None, '''
+            include config.mk
+            '''),
+            (None, '''
+            ## __LAUNCH_FROM_BASE_ENV__ create-env: initialize python virtual enviroment
+            .PHONY: create-env
+            create-env:
+            	virtualenv $(ENV_NAME)
+            '''),
+            (None, '''
+            ## activate-env: activate python virtual enviroment
+            .PHONY: activate-env
+            activate-env:
+            	@echo "Command stored! You can past and run it in the CLI."
+            	@echo "$(ENV_NAME)\\Scripts\\activate.bat" | clip
+            '''),
+            (None, '''
+            ## init: initialize package basic dependencies (every requirements group)
+            .PHONY: init
+            init:
+            	$(PIP_INSTALL) -r ./requirements.txt
+            '''),
+            (None, '''
+            ## init-runtime: install only the runtime dependencies
+            .PHONY: init-runtime
+            init-runtime:
+            	$(PIP_INSTALL) -r ./requirements/runtime.txt
+            '''),
+            ('notebooks', '''
+            ## register-env: register virtual enviroment in jupyter suite
+            .PHONY: register-env
+            register-env:
+            	$(PYTHON) -m ipykernel install --user --name=$(ENV_NAME)
+            '''),
+            (None, '''
+            ## reqs: save the imports detected by pipreqs to requirements/detected.txt
+            .PHONY: reqs
+            reqs:
+            	pipreqs ./ --encoding latin --ignore $(ENV_NAME) --savepath ./requirements/detected.txt
+            '''),
+            (None, '''
+            ## install-package: install python package in edit mode (runtime dependencies only)
+            .PHONY: install-package
+            install-package:
+            	$(PIP_INSTALL) -e .
+            '''),
+            (None, '''
+            ## install-dev: install python package in edit mode with the dev extra
+            .PHONY: install-dev
+            install-dev:
+            	$(PIP_INSTALL) -e .[dev]
+            '''),
+            ('dashboard', '''
+            ## streamlit-run: run streamlit app
+            .PHONY: streamlit-run
+            streamlit-run:
+            	cd ./dashboard && streamlit run app.py
+            '''),
+            ('docs', '''
+            ## docs-serve: serve package docs on localhost
+            .PHONY: docs-serve
+            docs-serve:
+            	mkdocs serve
+            '''),
+            ('docs', '''
+            ## docs-build: build package docs as static html website
+            .PHONY: docs-build
+            docs-build:
+            	mkdocs build --no-directory-urls
+            '''),
+            ('docker', '''
+            ## docker-build: build the dashboard image (BuildKit enables the pip cache mounts)
+            .PHONY: docker-build
+            docker-build:
+            	DOCKER_BUILDKIT=1 COMPOSE_DOCKER_CLI_BUILD=1 docker-compose build
+            '''),
+            (None, '''
+            ## test: execute tests with pytest (HTML=1 to also dump the html report)
+            .PHONY: test
+            test:
+            	cd tests && $(PYTHON) test_loguru.py && pytest $(PYTEST_ARGS) $(if $(HTML),--html=pytest-report.html)
+            '''),
+            (None, '''
+            ## test-parallel: execute tests on every core with pytest-xdist
+            .PHONY: test-parallel
+            test-parallel:
+            	cd tests && pytest -n auto $(PYTEST_ARGS)
+            '''),
+            (None, '''
+            ## test-shard: execute shard SHARD (0 based) out of SHARDS, e.g. one per CI runner
+            .PHONY: test-shard
+            test-shard:
+            	cd tests && pytest --num-shards=$(SHARDS) --shard-id=$(SHARD) $(PYTEST_ARGS)
+            '''),
+            (None, '''
+            ## test-failed: execute only the tests that failed last time (nothing if none failed)
+            .PHONY: test-failed
+            test-failed:
+            	cd tests && pytest --last-failed --last-failed-no-failures none $(PYTEST_ARGS)
+            '''),
+            (None, '''
+            ## test-changed: execute only the test files changed or added since the last commit
+            .PHONY: test-changed
+            test-changed:
+            	@cd tests && files="$$(git diff --name-only --relative HEAD -- . ; git ls-files --others --exclude-standard -- .)"; \\
+            	files="$$(echo "$$files" | grep '\\.py$$' | sort -u)"; \\
+            	if [ -n "$$files" ]; then pytest $(PYTEST_ARGS) $$files; else echo "No changed test files"; fi
+            '''),
+            (None, '''
+            ## data-compact: convert the CSV files of data/ to DATA_FORMAT (feather or parquet), cached on their hash
+            .PHONY: data-compact
+            data-compact:
+            	$(PYTHON) -m {project_name}.io --format $(DATA_FORMAT)
+            '''),
+            (None, '''
+            ## bench: run the benchmarks and save the results to benchmarks/results.json
+            .PHONY: bench
+            bench:
+            	cd benchmarks && pytest --benchmark-json=results.json
+            '''),
+            (None, '''
+            ## bench-baseline: run the benchmarks and store the results as the new baseline
+            .PHONY: bench-baseline
+            bench-baseline:
+            	cd benchmarks && pytest --benchmark-json=baseline.json
+            '''),
+            (None, '''
+            ## bench-compare: run the benchmarks and fail if any is slower than the baseline by more than BENCH_THRESHOLD %
+            .PHONY: bench-compare
+            bench-compare: bench
+            	$(PYTHON) benchmarks/compare.py benchmarks/baseline.json benchmarks/results.json --threshold $(BENCH_THRESHOLD)
+            '''),
+            (None, '''
+            ## profile: profile the CPU time of PROFILE_ENTRY (script, module or module:function) into profiles/
+            .PHONY: profile
+            profile:
+            	$(if $(PROFILE_ENTRY),,$(error PROFILE_ENTRY is not set))
+            	$(PYTHON) -m {project_name}.utils.profiling cpu $(PROFILE_ENTRY)
+            '''),
+            (None, '''
+            ## memprofile: profile the memory allocations of PROFILE_ENTRY into profiles/
+            .PHONY: memprofile
+            memprofile:
+            	$(if $(PROFILE_ENTRY),,$(error PROFILE_ENTRY is not set))
+            	$(PYTHON) -m {project_name}.utils.profiling memory $(PROFILE_ENTRY)
+            '''),
+            (None, '''
+            .PHONY: help
+            help: Makefile
+            	@sed -n 's/^## //p' $<
+            ''')
+            ]
+        makefile = b'\n\n'.join(
+            self.render_template(target) for name, target in make_targets if name is None or name in components
+            )
+
+        make_config = [
+            self.render_template(
+                '''
+                ENV_NAME = {project_env}
+                PYTHON = $(ENV_NAME)/Scripts/python.exe
+                '''
+                )
+            ]
+        if self.options['wheelhouse']:
+            # install from the local wheelhouse (`fireup wheelhouse build`) without reaching any index
+            make_config.append(self.render_template(
+                '''
+                WHEELHOUSE = {wheelhouse}
+                PIP_INSTALL = $(PYTHON) -m pip install --no-index --find-links $(WHEELHOUSE)
+                ''',
+                wheelhouse=self.options['wheelhouse']
+                ))
+        else:
+            make_config.append(self.render_template(
+                '''
+                PIP_INSTALL = $(PYTHON) -m pip install
+                '''
+                ))
+        make_config.append(self.render_template(
+            '''
+            PYTEST_ARGS = --durations=10
+            SHARDS = 1
+            SHARD = 0
+            BENCH_THRESHOLD = 10
+            PROFILE_ENTRY = {profile_entry}
+            DATA_FORMAT = feather
+            ''',
+            profile_entry='dashboard/app.py' if 'dashboard' in components else ''
+            ))
+        make_config = b'\n'.join(make_config)
+
+        dotenv = self.render_template(
+            '''
+            LOGURU_LEVEL='DEBUG'
+            '''
+            )
+
+        # heavy dependencies are imported on first use, so that importing the package stays cheap
+        package_init = [
+            self.render_template(
+                '''
+                """{project_name_str} package.
+
+                Heavy dependencies (python-dotenv{hydra_deps}) are only imported on first use, so
+                that `import {project_name}` stays cheap: see tests/test_import_time.py.
+                """
+                ''',
+                hydra_deps=', Hydra, OmegaConf' if 'hydra' in components else ''
+                )
+            ]
+        if 'hydra' in components:
+            package_init.append(self.render_template(
+                '''
+                import copy
+                import importlib
+                import os
+                import threading
+                '''
+                ))
+        package_init.append(self.render_template(
+            '''
+            _env_loaded = False
+
+            def load_env() -> None:
+                """Load the project .env file into os.environ, on the first call only."""
+                global _env_loaded
+                if not _env_loaded:
+                    from dotenv import load_dotenv
+                    load_dotenv()
+                    _env_loaded = True
+            '''
+            ))
+        if 'hydra' in components:
+            package_init.append(self.render_template(
+                '''
+                # module attributes resolved lazily through __getattr__ (PEP 562): name -> (module, attribute)
+                _LAZY_ATTRIBUTES = {{
+                    "he": ("hydra.experimental", None),
+                    "GlobalHydra": ("hydra.core.global_hydra", "GlobalHydra"),
+                    "OmegaConf": ("omegaconf", "OmegaConf"),
+                }}
+
+                def __getattr__(name: str):
+                    if name not in _LAZY_ATTRIBUTES:
+                        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+                    load_env()
+                    module_name, attribute = _LAZY_ATTRIBUTES[name]
+                    value = importlib.import_module(module_name)
+                    if attribute is not None:
+                        value = getattr(value, attribute)
+                    # cache the attribute, later lookups no longer go through __getattr__
+                    globals()[name] = value
+                    return value
+
+                def __dir__() -> list:
+                    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+                def _lazy(name: str):
+                    return globals()[name] if name in globals() else __getattr__(name)
+
+                CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config")
+
+                # composed configs per set of overrides, with the config/ snapshot they were composed from
+                _config_cache: dict = {{}}
+                _config_lock = threading.Lock()
+
+                def _config_snapshot() -> tuple:
+                    # changes whenever a file under config/ is edited, added or removed
+                    return tuple(sorted(
+                        (os.path.join(root, name), stat.st_mtime_ns, stat.st_size)
+                        for root, _, names in os.walk(CONFIG_DIR)
+                        for name in names
+                        for stat in [os.stat(os.path.join(root, name))]
+                        ))
+
+                def serve_config(overrides: tuple = ()) -> dict:
+                    """Compose the Hydra config once per set of overrides, until config/ changes.
+
+                    Safe to call concurrently (e.g. from several Streamlit sessions): Hydra's global
+                    state is only touched under a lock, and every caller gets its own copy.
+                    """
+                    overrides = tuple(overrides)
+                    snapshot = _config_snapshot()
+                    with _config_lock:
+                        cached = _config_cache.get(overrides)
+                        if cached is None or cached[0] != snapshot:
+                            if cached is not None:
+                                # config/ changed, every composed config is stale
+                                _config_cache.clear()
+                            he, GlobalHydra, OmegaConf = _lazy("he"), _lazy("GlobalHydra"), _lazy("OmegaConf")
+                            GlobalHydra.instance().clear()
+                            he.initialize(config_path="../config")
+                            config = OmegaConf.to_container(he.compose("config", overrides=list(overrides))) # type: ignore
+                            cached = _config_cache[overrides] = (snapshot, config)
+                    return copy.deepcopy(cached[1])
+                '''
+                ))
+        package_init = b'\n\n'.join(package_init)
+
+        test_pytest = self.render_template(
+            '''
+            # pytest (create make command to execute test with pytest --html=pytest_report.html)
+            class TestClass:
+                def test_passed(self):
+                    x = "cane"
+                    assert "c" in x
+
+                def test_failed(self):
+                    x = "gatto"
+                    assert hasattr(x, "check")
+            '''
+            )
+
+        test_loguru = self.render_template(
+            '''
+            from dotenv import load_dotenv
+            load_dotenv()
+            from loguru import logger
+
+            logger.debug("this is a debugging message")
+            logger.info("this is an informational message")
+            logger.warning("this is a warning message")
+            logger.error("this is an error message")
+            logger.critical("this is a critical message")
+
+            print('')
+
+            @logger.catch
+            def divide_by(x):
+                return 1 / x
+
+            if __name__ == '__main__':
+                divide_by(0)
+            '''
+            )
+
+        # `--num-shards`/`--shard-id` split the suite on a stable hash of the test ids, so that
+        # adding a test never moves the others to a different shard
+        test_conftest = self.render_template(
+            '''
+            import zlib
+
+            import pytest
+
+            def pytest_addoption(parser):
+                group = parser.getgroup("sharding")
+                group.addoption("--num-shards", type=int, default=1, help="Split the test suite in this many shards.")
+                group.addoption("--shard-id", type=int, default=0, help="Shard to execute, from 0 to --num-shards - 1.")
+
+            def pytest_collection_modifyitems(config, items):
+                num_shards = config.getoption("num_shards")
+                shard_id = config.getoption("shard_id")
+                if num_shards <= 1:
+                    return
+                if not 0 <= shard_id < num_shards:
+                    raise pytest.UsageError(f"--shard-id must be between 0 and {{num_shards - 1}}")
+                selected, deselected = [], []
+                for item in items:
+                    shard = zlib.crc32(item.nodeid.encode("utf-8")) % num_shards
+                    (selected if shard == shard_id else deselected).append(item)
+                if deselected:
+                    config.hook.pytest_deselected(items=deselected)
+                    items[:] = selected
+            '''
+            )
+
+        test_import_time = self.render_template(
+            '''
+            import subprocess
+            import sys
+
+            # cumulative `import {project_name}` budget, in milliseconds
+            IMPORT_TIME_BUDGET_MS = 100
+
+            HEAVY_MODULES = ("dotenv", "hydra", "omegaconf", "pyarrow")
+
+            def import_time_ms(module: str) -> float:
+                result = subprocess.run(
+                    [sys.executable, "-X", "importtime", "-c", f"import {{module}}"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                for line in result.stderr.splitlines():
+                    fields = line.split("|")
+                    if len(fields) == 3 and fields[2].strip() == module:
+                        return int(fields[1]) / 1000
+                raise AssertionError(f"no import time reported for {{module}}")
+
+            def test_import_time_within_budget():
+                assert import_time_ms("{project_name}") < IMPORT_TIME_BUDGET_MS
+
+            def test_heavy_modules_are_imported_lazily():
+                code = f"import sys, {project_name}; print([m for m in {{HEAVY_MODULES!r}} if m in sys.modules])"
+                result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+                assert result.stdout.strip() == "[]"
+            '''
+            )
+
+        # benchmarks/ is a pytest-benchmark suite of its own, see benchmarks/pytest.ini
+        bench_config = self.render_template(
+            '''
+            [pytest]
+            python_files = bench_*.py
+            python_functions = bench_*
+            addopts = --benchmark-only --benchmark-sort=name
+            '''
+            )
+
+        bench_core = self.render_template(
+            '''
+            """Sample micro-benchmarks for {project_name}.core, replace them with your own."""
+            import importlib
+
+            from {project_name} import core
+
+            def bench_core_import(benchmark):
+                benchmark(importlib.reload, core)
+
+            def bench_sample_workload(benchmark):
+                data = list(range(10_000))
+                result = benchmark(sorted, data, reverse=True)
+                assert result[0] == 9_999
+            '''
+            )
+
+        bench_logging = self.render_template(
+            '''
+            """Per-call overhead of logging with {project_name}.utils.logging, discarded and queued messages."""
+            import pytest
+            from loguru import logger
+
+            from {project_name}.utils.logging import is_enabled, lazy, setup_logging
+
+            def expensive() -> str:
+                return ",".join(map(str, range(100)))
+
+            @pytest.fixture(autouse=True, scope="module")
+            def queued_logging(tmp_path_factory):
+                setup_logging(level="INFO", log_dir=str(tmp_path_factory.mktemp("logs")), stderr=False, json=True)
+                yield
+                logger.remove()
+
+            def bench_discarded_fstring(benchmark):
+                benchmark(lambda: logger.debug(f"values {{expensive()}}"))
+
+            def bench_discarded_lazy(benchmark):
+                benchmark(lambda: lazy.debug("values {{}}", expensive))
+
+            def bench_discarded_gated(benchmark):
+                def log():
+                    if is_enabled("DEBUG"):
+                        logger.debug("values {{}}", expensive())
+                benchmark(log)
+
+            def bench_queued(benchmark):
+                benchmark(lambda: logger.info("value {{}}", 42))
+            '''
+            )
+
+        bench_compare = self.render_template(
+            '''
+            """Compare two pytest-benchmark JSON files, failing when a benchmark got slower than allowed."""
+            import argparse
+            import json
+            import sys
+
+            def load(path: str) -> dict:
+                with open(path) as f:
+                    data = json.load(f)
+                return {{benchmark["fullname"]: benchmark["stats"] for benchmark in data.get("benchmarks", [])}}
+
+            def main(argv: list = None) -> int:
+                parser = argparse.ArgumentParser(description=__doc__)
+                parser.add_argument("baseline")
+                parser.add_argument("results")
+                parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown, in percent")
+                parser.add_argument("--stat", default="median", help="pytest-benchmark statistic to compare")
+                args = parser.parse_args(argv)
+
+                baseline, results = load(args.baseline), load(args.results)
+                if not baseline:
+                    print("The baseline is empty, store one with `make bench-baseline`.")
+                    return 0
+                regressions = 0
+                for name, stats in sorted(results.items()):
+                    if name not in baseline:
+                        print(f"[new] {{name}}")
+                        continue
+                    before, after = baseline[name][args.stat], stats[args.stat]
+                    change = (after - before) / before * 100
+                    regressed = change > args.threshold
+                    regressions += regressed
+                    status = "regression" if regressed else "ok"
+                    print(f"[{{status}}] {{name}}: {{before * 1e6:.2f}}us -> {{after * 1e6:.2f}}us ({{change:+.1f}}%)")
+                return 1 if regressions else 0
+
+            if __name__ == "__main__":
+                sys.exit(main())
+            '''
+            )
+
+        # data access layer: CSV files are streamed and converted once to a columnar, memory-mappable format
+        data_io = self.render_template(
+            '''
+            """Chunked and memory-mapped access to the files of the data/ folder.
+
+            Large files are streamed in chunks (`iter_chunks`, `iter_lines`, `iter_csv`) instead of being loaded
+            at once. CSV files are converted once by `compact` to a columnar format: Feather (uncompressed Arrow
+            IPC) by default, which `load` maps into memory without copying, or Parquet. Converted artifacts are
+            cached in data/.cache/, keyed on the path and the hash of their source, and rebuilt only when the
+            source changes.
+
+            Run `python -m {project_name}.io` (or `make data-compact`) to convert every CSV file of data/.
+            """
+            import functools
+            import glob
+            import hashlib
+            import os
+            from pathlib import Path
+
+            # the project data/ folder whatever the working directory (the dashboard runs from dashboard/)
+            DATA_DIR = Path(os.environ.get("DATA_DIR", Path(__file__).resolve().parents[2] / "data"))
+            CACHE_DIR = DATA_DIR / ".cache"
+            FORMATS = {{"feather": ".arrow", "parquet": ".parquet"}}
+            CHUNK_SIZE = 1 << 20
+
+            def iter_chunks(path, chunk_size: int = CHUNK_SIZE):
+                """Yield the content of a file as bytes chunks of `chunk_size`."""
+                with open(path, "rb") as f:
+                    yield from iter(functools.partial(f.read, chunk_size), b"")
+
+            def iter_lines(path, encoding: str = "utf-8"):
+                """Yield the lines of a text file, one at a time."""
+                with open(path, encoding=encoding) as f:
+                    yield from f
+
+            def iter_csv(path, block_size: int = 16 * CHUNK_SIZE, read_options=None, convert_options=None):
+                """Stream a CSV file as pyarrow RecordBatches of about `block_size` bytes (`batch.to_pandas()` if needed).
+
+                Column types are inferred from the first block: pass `convert_options=pyarrow.csv.ConvertOptions(
+                column_types=...)` when later rows do not match it.
+                """
+                from pyarrow import csv
+
+                read_options = read_options or csv.ReadOptions()
+                read_options.block_size = block_size
+                return csv.open_csv(path, read_options=read_options, convert_options=convert_options)
+
+            # hashes of the files already hashed by this process, keyed on their path, size and modification time
+            _hashes = {{}}
+
+            def file_hash(path) -> str:
+                """Hash of the content of a file, read in chunks."""
+                stat = os.stat(path)
+                key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+                if key not in _hashes:
+                    digest = hashlib.blake2b(digest_size=16)
+                    for chunk in iter_chunks(path):
+                        digest.update(chunk)
+                    _hashes[key] = digest.hexdigest()
+                return _hashes[key]
+
+            def source_key(path) -> str:
+                """Short hash of the path of a source file, relative to DATA_DIR when it is inside it."""
+                path = Path(path).resolve()
+                try:
+                    path = path.relative_to(DATA_DIR.resolve())
+                except ValueError:
+                    pass
+                return hashlib.blake2b(path.as_posix().encode(), digest_size=8).hexdigest()
+
+            def compact(path, format: str = "feather", force: bool = False, **csv_options) -> Path:
+                """Convert a CSV file to `format` batch by batch, unless already cached, and return the artifact path."""
+                path = Path(path)
+                suffix = FORMATS[format]
+                # sources with the same name in different folders get their own artifacts
+                prefix = f"{{path.stem}}-{{source_key(path)}}"
+                target = CACHE_DIR / f"{{prefix}}-{{file_hash(path)}}{{suffix}}"
+                if target.exists() and not force:
+                    return target
+
+                batches = iter_csv(path, **csv_options)
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                partial = target.with_name(target.name + ".partial")
+                if format == "feather":
+                    from pyarrow import ipc
+                    writer = ipc.new_file(str(partial), batches.schema)
+                else:
+                    from pyarrow import parquet
+                    writer = parquet.ParquetWriter(str(partial), batches.schema)
+                with writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+                os.replace(partial, target)
+
+                # artifacts of previous versions of the same source are stale
+                for stale in CACHE_DIR.glob(f"{{glob.escape(prefix)}}-{{'?' * 32}}{{suffix}}"):
+                    if stale != target:
+                        stale.unlink()
+                return target
+
+            def load(path, columns: list = None, format: str = "feather"):
+                """Load a data file as a pyarrow Table (`table.to_pandas()` if needed).
+
+                CSV files are compacted to `format` first. Feather files are memory-mapped: nothing is copied and
+                pages are only read from disk when accessed. Parquet files are decoded, `columns` only.
+                """
+                path = Path(path)
+                if path.suffix == ".csv":
+                    path = compact(path, format)
+                if path.suffix == ".parquet":
+                    from pyarrow import parquet
+                    return parquet.read_table(str(path), columns=columns, memory_map=True)
+                from pyarrow import feather
+                return feather.read_table(str(path), columns=columns, memory_map=True)
+            '''
+            )
+
+        data_io_main = self.render_template(
+            '''
+            import argparse
+
+            from {project_name}.io import CACHE_DIR, DATA_DIR, FORMATS, compact
+
+            def main(argv: list = None) -> None:
+                parser = argparse.ArgumentParser(description="Convert CSV files to a columnar format, cached on their hash.")
+                parser.add_argument("paths", nargs="*", help="CSV files, every CSV file of data/ by default")
+                parser.add_argument("--format", choices=FORMATS, default="feather")
+                parser.add_argument("--force", action="store_true", help="convert even if already cached")
+                args = parser.parse_args(argv)
+
+                paths = args.paths or sorted(path for path in DATA_DIR.rglob("*.csv") if CACHE_DIR not in path.parents)
+                for path in paths:
+                    print(f"{{path}} -> {{compact(path, args.format, args.force)}}")
+
+            if __name__ == "__main__":
+                main()
+            '''
+            )
+
+        # loguru setup for production use: queued sinks, so that logging never blocks the calling thread
+        logging_setup = self.render_template(
+            '''
+            """Non-blocking, lazily evaluated logging for {project_name}, on top of loguru.
+
+            Call `setup_logging()` once at startup: it replaces loguru's default synchronous stderr sink with
+            queued ones (`enqueue=True`), formatted and written by a background thread, plus a rotating and
+            compressed log file and optionally a JSON lines file written in batches. Call `logger.complete()`
+            to wait for the queued messages.
+
+            Messages below the configured level are dropped before formatting, but their arguments are still
+            evaluated: pass expensive ones as callables to `lazy` (`lazy.debug("state {{}}", lambda: dump(state))`)
+            or guard whole blocks with `is_enabled("DEBUG")`. Prefer `logger.debug("x={{}}", x)` to f-strings.
+            """
+            import functools
+            import os
+            import sys
+            import time
+
+            from loguru import logger
+
+            from {project_name} import load_env
+
+            LOG_DIR = "logs"
+
+            # level used when LOGURU_LEVEL is set neither in the environment nor in .env, as loguru's own default
+            DEFAULT_LEVEL = "DEBUG"
+
+            # `lazy.<level>(message, callable, ...)` only calls its arguments when the message is emitted
+            lazy = logger.opt(lazy=True)
+
+            @functools.lru_cache(maxsize=None)
+            def _level_no(level: str) -> int:
+                return logger.level(level).no
+
+            def configured_level() -> str:
+                """LOGURU_LEVEL from the environment or the project .env file."""
+                load_env()
+                return os.environ.get("LOGURU_LEVEL", DEFAULT_LEVEL)
+
+            _min_level = _level_no(configured_level())
+
+            def is_enabled(level: str) -> bool:
+                """Whether messages of the given level are emitted, to skip building discarded ones."""
+                return _level_no(level) >= _min_level
+
+            class BatchedJsonSink:
+                """Sink writing serialized records to a JSON lines file in batches, with a single write call.
+
+                A batch is written once `batch_size` records are pending or `flush_interval` seconds have passed
+                since the last write (checked on each record), and the rest when the sink is removed.
+                """
+
+                def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 1.0):
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    self.batch_size = batch_size
+                    self.flush_interval = flush_interval
+                    self._file = open(path, "a", encoding="utf-8")
+                    self._batch = []
+                    self._last_write = time.monotonic()
+
+                def write(self, message: str) -> None:
+                    self._batch.append(message)
+                    if len(self._batch) >= self.batch_size or time.monotonic() - self._last_write >= self.flush_interval:
+                        self.write_batch()
+
+                def write_batch(self) -> None:
+                    self._file.write("".join(self._batch))
+                    self._file.flush()
+                    self._batch.clear()
+                    self._last_write = time.monotonic()
+
+                def stop(self) -> None:
+                    self.write_batch()
+                    self._file.close()
+
+            def setup_logging(
+                level: str = None,
+                log_dir: str = LOG_DIR,
+                stderr: bool = True,
+                json: bool = False,
+                rotation: str = "50 MB",
+                retention: str = "10 days",
+                compression: str = "gz",
+                batch_size: int = 100,
+                ) -> None:
+                """Configure queued stderr, rotating file and (with `json=True`) batched JSON lines sinks."""
+                global _min_level
+                level = level or configured_level()
+                _min_level = _level_no(level)
+
+                logger.remove()
+                if stderr:
+                    logger.add(sys.stderr, level=level, enqueue=True, diagnose=False)
+                if log_dir:
+                    logger.add(
+                        os.path.join(log_dir, "{project_name}.log"),
+                        level=level,
+                        enqueue=True,
+                        rotation=rotation,
+                        retention=retention,
+                        compression=compression,
+                        diagnose=False,
+                    )
+                    if json:
+                        sink = BatchedJsonSink(os.path.join(log_dir, "{project_name}.jsonl"), batch_size)
+                        logger.add(sink, level=level, enqueue=True, serialize=True, diagnose=False)
+            '''
+            )
+
+        profiling = self.render_template(
+            '''
+            """Profiling helpers: timers logged through loguru, cProfile captures, stack samples and tracemalloc diffs.
+
+            Profile an entry point (a script path, a module or `module:function`) from the command line with
+            `python -m {project_name}.utils.profiling cpu|memory ENTRY`, or `make profile`/`make memprofile`.
+            Reports are written to the profiles/ folder.
+            """
+            import contextlib
+            import functools
+            import time
+            from pathlib import Path
+
+            from loguru import logger
+
+            PROFILES_DIR = Path("profiles")
+
+            @contextlib.contextmanager
+            def timer(name: str, level: str = "DEBUG"):
+                """Log the wall-clock time spent in the block."""
+                start = time.perf_counter()
+                try:
+                    yield
+                finally:
+                    logger.log(level, "{{}} took {{:.3f}} ms", name, (time.perf_counter() - start) * 1000)
+
+            def timed(func=None, *, level: str = "DEBUG"):
+                """Decorator logging the wall-clock time of every call of the decorated function."""
+                if func is None:
+                    return functools.partial(timed, level=level)
+
+                @functools.wraps(func)
+                def wrapper(*args, **kwargs):
+                    with timer(func.__qualname__, level):
+                        return func(*args, **kwargs)
+                return wrapper
+
+            @contextlib.contextmanager
+            def cprofile(name: str = "profile", sort: str = "cumulative", limit: int = 50):
+                """Profile the block with cProfile into profiles/<name>.prof (for snakeviz) and a sorted <name>.txt report."""
+                import cProfile
+                import pstats
+
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    yield profiler
+                finally:
+                    profiler.disable()
+                    PROFILES_DIR.mkdir(exist_ok=True)
+                    profiler.dump_stats(PROFILES_DIR / f"{{name}}.prof")
+                    with open(PROFILES_DIR / f"{{name}}.txt", "w") as f:
+                        pstats.Stats(profiler, stream=f).sort_stats(sort).print_stats(limit)
+                    logger.info("CPU profile written to {{}}", PROFILES_DIR / f"{{name}}.txt")
+
+            @contextlib.contextmanager
+            def sample_stacks(name: str = "profile", interval: float = 0.005):
+                """Sample the stack of the calling thread into profiles/<name>.folded, for flamegraph.pl or speedscope."""
+                import collections
+                import sys
+                import threading
+
+                thread_id = threading.get_ident()
+                stacks = collections.Counter()
+                done = threading.Event()
+
+                def sample():
+                    while not done.wait(interval):
+                        frame = sys._current_frames().get(thread_id)
+                        stack = []
+                        while frame is not None:
+                            code = frame.f_code
+                            stack.append(f"{{code.co_name}} ({{code.co_filename}}:{{code.co_firstlineno}})")
+                            frame = frame.f_back
+                        stacks[";".join(reversed(stack))] += 1
+
+                sampler = threading.Thread(target=sample, daemon=True)
+                sampler.start()
+                try:
+                    yield stacks
+                finally:
+                    done.set()
+                    sampler.join()
+                    PROFILES_DIR.mkdir(exist_ok=True)
+                    with open(PROFILES_DIR / f"{{name}}.folded", "w") as f:
+                        f.writelines(f"{{stack}} {{count}}\\n" for stack, count in stacks.items())
+                    logger.info("Stack samples written to {{}}", PROFILES_DIR / f"{{name}}.folded")
+
+            @contextlib.contextmanager
+            def memory_diff(name: str = "memory", limit: int = 50, key_type: str = "lineno", frames: int = 1):
+                """Trace the allocations of the block with tracemalloc, writing the largest differences to profiles/<name>.txt.
+
+                Use `key_type="traceback"` with more `frames` to see where allocations come from, at a higher cost.
+                """
+                import tracemalloc
+
+                started = not tracemalloc.is_tracing()
+                if started:
+                    tracemalloc.start(frames)
+                before = tracemalloc.take_snapshot()
+                try:
+                    yield
+                finally:
+                    after = tracemalloc.take_snapshot()
+                    current, peak = tracemalloc.get_traced_memory()
+                    if started:
+                        tracemalloc.stop()
+                    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+                    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), key_type)
+                    PROFILES_DIR.mkdir(exist_ok=True)
+                    with open(PROFILES_DIR / f"{{name}}.txt", "w") as f:
+                        f.write(f"current {{current / 1024:.1f}} KiB, peak {{peak / 1024:.1f}} KiB\\n\\n")
+                        f.writelines(f"{{stat}}\\n" for stat in stats[:limit])
+                    logger.info("Memory profile written to {{}}", PROFILES_DIR / f"{{name}}.txt")
+
+            def run_entry(entry: str) -> None:
+                """Run a script path or a module as __main__, or call a `module:function` entry point."""
+                import importlib
+                import os
+                import runpy
+                import sys
+
+                if entry.endswith(".py"):
+                    sys.path.insert(0, os.path.dirname(os.path.abspath(entry)))
+                    sys.argv = [entry]
+                    runpy.run_path(entry, run_name="__main__")
+                elif ":" in entry:
+                    module, function = entry.split(":", 1)
+                    getattr(importlib.import_module(module), function)()
+                else:
+                    runpy.run_module(entry, run_name="__main__", alter_sys=True)
+
+            def main(argv: list = None) -> None:
+                import argparse
+                import re
+
+                parser = argparse.ArgumentParser(description="Profile an entry point, writing the reports to profiles/.")
+                parser.add_argument("mode", choices=["cpu", "memory"])
+                parser.add_argument("entry", help="script path, module or module:function")
+                parser.add_argument("--name", help="report name, derived from the entry point by default")
+                args = parser.parse_args(argv)
+
+                name = args.name or re.sub(r"[^\\w.-]+", "_", args.entry)
+                if args.mode == "cpu":
+                    with cprofile(name), sample_stacks(name):
+                        run_entry(args.entry)
+                else:
+                    with memory_diff(f"{{name}}.memory"):
+                        run_entry(args.entry)
+
+            if __name__ == "__main__":
+                main()
+            '''
+            )
+
+        dirs = [
+            '{project_name}',
+            '{project_name}/core',
+            '{project_name}/io',
+            '{project_name}/utils',
+            'benchmarks',
+            'data',
+            'requirements',
+            'tests'
+            ]
+
+        files = {
+            # make `project_name` dir a proper Python package
+            '{project_name}/__init__.py': package_init,
+            '{project_name}/core/__init__.py': b'',
+            '{project_name}/io/__init__.py': data_io,
+            '{project_name}/io/__main__.py': data_io_main,
+            '{project_name}/utils/__init__.py': b'',
+            '{project_name}/utils/logging.py': logging_setup,
+            '{project_name}/utils/profiling.py': profiling,
+            'tests/test_pytest.py': test_pytest,
+            'tests/test_loguru.py': test_loguru,
+            'tests/test_import_time.py': test_import_time,
+            'tests/conftest.py': test_conftest,
+            'benchmarks/pytest.ini': bench_config,
+            'benchmarks/bench_core.py': bench_core,
+            'benchmarks/bench_logging.py': bench_logging,
+            'benchmarks/compare.py': bench_compare,
+            'benchmarks/baseline.json': b'{"benchmarks": []}\n',
+            'README.md': readme,
+            '.env': dotenv,
+            'setup.py': setup,
+            'requirements.txt': requirements,
+            **{
+                f'requirements/{group}.txt': format_code('\n'.join(packages)).encode('utf-8')
+                for group, packages in groups.items()
+                },
+            '.gitignore': gitignore,
+            'Makefile': makefile,
+            'config.mk': make_config
+            }
+
+        return dirs, files
+
+    @component('hydra', help='Hydra configuration folder and `serve_config()` helper.')
+    def render_hydra(self):
+
+        config_yaml = self.render_template(
+            '''
+            defaults:
+              - animal: cane
+            '''
+            )
+
+        config_cane = self.render_template(
+            '''
+            # @package _group_
+            nome: fido
+            verso: bau
+            '''
+            )
+
+        config_gatto = self.render_template(
+            '''
+            # @package _group_
+            nome: micio
+            verso: miao
+            '''
+            )
+
+        dirs = ['config', 'config/animal']
+
+        files = {
+            'config/config.yaml': config_yaml,
+            'config/animal/cane.yaml': config_cane,
+            'config/animal/gatto.yaml': config_gatto
+            }
+
+        return dirs, files
+
+    @component('dashboard', requires=['hydra'], help='Streamlit dashboard.')
+    def render_dashboard(self):
+
+        # Streamlit reruns app.py on every interaction: resources are created once per process and data
+        # loads memoized, through the tracked cache decorators of dashboard/utils.py
+        streamlit_app = self.render_template(
+            '''
+            #!/usr/bin/env python3
+            # -*- coding: utf-8 -*-
+            # pylint: disable=E1120
+
+            import time
+
+            started = time.perf_counter()
+
+            import streamlit as st
+
+            from components.data import list_data_files, load_tables, sample_table
+            from utils import debug_sidebar
+            from {project_name} import serve_config
+
+            def main() -> None:
+
+                # not cached here: serve_config() is memoized already, reloads when config/ changes and
+                # returns a copy per caller, so that sessions never share a mutable configuration
+                config = serve_config()
+
+                st.sidebar.markdown("# {project_name_str} - dashboard")
+                st.write("# Hello from {project_name_str}!")
+                st.write("_built with FireUp!_")
+
+                files = list_data_files()
+                selected = st.multiselect("Data files", files, default=files[:1])
+                if selected:
+                    tables = load_tables(tuple(selected))
+                else:
+                    tables = [sample_table(st.slider("Rows", 100, 100_000, 1_000, step=100))]
+                for table in tables:
+                    st.dataframe(table.head(100))
+                    st.line_chart(table.describe())
+
+                st.write(config)
+
+                debug_sidebar(started)
+
+            if __name__ == "__main__":
+                main()
+            '''
+            )
+
+        dashboard_utils = self.render_template(
+            '''
+            """Cache decorators counting their hits, and the debug sidebar showing them with the rerun time."""
+            import collections
+            import functools
+            import time
+
+            import streamlit as st
+
+            # calls and misses of every tracked cache, per process (shared by all the sessions)
+            CACHE_STATS = collections.defaultdict(collections.Counter)
+
+            def _tracked(cache, **options):
+                def decorator(func):
+                    stats = CACHE_STATS[func.__qualname__]
+
+                    @functools.wraps(func)
+                    def miss(*args, **kwargs):
+                        stats["misses"] += 1
+                        return func(*args, **kwargs)
+                    cached = cache(**options)(miss)
+
+                    @functools.wraps(func)
+                    def call(*args, **kwargs):
+                        stats["calls"] += 1
+                        return cached(*args, **kwargs)
+                    call.clear = cached.clear
+                    return call
+                return decorator
+
+            def cached_resource(**options):
+                """`st.cache_resource`: one shared, unserialized object per process (clients, models, pools)."""
+                return _tracked(st.cache_resource, **options)
+
+            def cached_data(ttl: float = 600, max_entries: int = 32, **options):
+                """`st.cache_data`: serialized results, evicted after `ttl` seconds or beyond `max_entries`."""
+                return _tracked(st.cache_data, ttl=ttl, max_entries=max_entries, **options)
+
+            def debug_sidebar(started: float) -> None:
+                """Sidebar section with the duration of the current rerun and the hit rate of every tracked cache."""
+                with st.sidebar.expander("Debug"):
+                    st.write(f"Rerun time: {{(time.perf_counter() - started) * 1000:.1f}} ms")
+                    st.table([
+                        {{
+                            "cache": name,
+                            "calls": stats["calls"],
+                            "hits": stats["calls"] - stats["misses"],
+                            "hit rate": f"{{(stats['calls'] - stats['misses']) / max(stats['calls'], 1):.0%}}",
+                        }}
+                        for name, stats in sorted(CACHE_STATS.items())
+                    ])
+                    if st.button("Clear caches"):
+                        st.cache_data.clear()
+                        st.cache_resource.clear()
+                        CACHE_STATS.clear()
+            '''
+            )
+
+        dashboard_data = self.render_template(
+            '''
+            """Data loads, memoized with `st.cache_data` so that reruns never read the same file twice."""
+            import numpy as np
+            import pandas as pd
+
+            from components.resources import get_executor
+            from {project_name}.io import DATA_DIR, load
+            from utils import cached_data
+
+            @cached_data(ttl=60)
+            def list_data_files() -> list:
+                return sorted(str(path) for path in DATA_DIR.glob("*.csv"))
+
+            def _load_table(path: str) -> pd.DataFrame:
+                # compacted once, then memory-mapped, see {project_name}.io
+                return load(path).to_pandas()
+
+            @cached_data(ttl=3600, max_entries=8)
+            def load_tables(paths: tuple) -> list:
+                """The given data files, read in parallel on the shared thread pool (pyarrow releases the GIL)."""
+                return list(get_executor().map(_load_table, paths))
+
+            @cached_data(max_entries=16)
+            def sample_table(rows: int) -> pd.DataFrame:
+                rng = np.random.default_rng(0)
+                return pd.DataFrame({{"x": rng.normal(size=rows).cumsum(), "y": rng.normal(size=rows).cumsum()}})
+            '''
+            )
+
+        dashboard_resources = self.render_template(
+            '''
+            """Shared resources, created once per process with `st.cache_resource` and reused by every rerun and session."""
+            from concurrent.futures import ThreadPoolExecutor
+
+            from utils import cached_resource
+
+            @cached_resource()
+            def get_executor() -> ThreadPoolExecutor:
+                """Thread pool for I/O bound work run in parallel, such as loading several data files."""
+                return ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard")
+            '''
+            )
+
+        dirs = ['dashboard', 'dashboard/assets', 'dashboard/components']
+
+        files = {
+            'dashboard/app.py': streamlit_app,
+            'dashboard/utils.py': dashboard_utils,
+            'dashboard/components/__init__.py': b'',
+            'dashboard/components/data.py': dashboard_data,
+            'dashboard/components/resources.py': dashboard_resources
+            }
+
+        return dirs, files
+
+    @component('docker', requires=['dashboard'], help='Dockerfile and docker-compose.yml for the dashboard.')
+    def render_docker(self):
+
+        optimized = self.options['docker_profile'] == 'optimized'
+
+        if optimized:
+            # multi-stage build: dependencies get their own layer keyed on requirements/runtime.txt and
+            # requirements/dashboard.txt only and BuildKit keeps pip's cache across builds, the runtime image is slim
+            dockerfile = self.render_template(
+                '''
+                # syntax=docker/dockerfile:1
+                # Copyright (c).
+                # Confidential and intended for internal use only.
+
+                ARG PYTHON_VERSION=3.7
+
+                # build stage: runtime and dashboard dependencies only, rebuilt when their requirements change
+                FROM python:${{PYTHON_VERSION}} AS build
+                ENV PIP_DISABLE_PIP_VERSION_CHECK=1
+                RUN python -m venv /opt/venv
+                ENV PATH=/opt/venv/bin:$PATH
+                COPY requirements/runtime.txt requirements/dashboard.txt /tmp/requirements/
+                RUN --mount=type=cache,target=/root/.cache/pip \\
+                    pip install -r /tmp/requirements/runtime.txt -r /tmp/requirements/dashboard.txt \\
+                 && python -m compileall -q /opt/venv
+
+                # runtime stage: slim image with the virtual environment and the sources the dashboard needs
+                FROM python:${{PYTHON_VERSION}}-slim AS runtime
+
+                LABEL maintainer="{author} <{email}>"
+
+                ENV PATH=/opt/venv/bin:$PATH \\
+                    PYTHONPATH=/app \\
+                    PYTHONUNBUFFERED=1 \\
+                    PYTHONDONTWRITEBYTECODE=1
+
+                COPY --from=build /opt/venv /opt/venv
+
+                # streamlit-specific settings
+                RUN mkdir -p /root/.streamlit \\
+                 && printf '[general]\\nemail = ""\\n' > /root/.streamlit/credentials.toml \\
+                 && printf '[server]\\nenableCORS = false\\nheadless = true\\n' > /root/.streamlit/config.toml
+
+                # sources last, so that code changes never invalidate the dependency layers
+                WORKDIR /app
+                COPY config/ ./config/
+                COPY {project_name}/ ./{project_name}/
+                COPY dashboard/ ./dashboard/
+                RUN python -m compileall -q /app
+
+                # exposing default port for streamlit
+                EXPOSE 8501
+
+                # run app
+                CMD ["streamlit", "run", "./dashboard/app.py"]
+                '''
+                )
+        else:
+            dockerfile = self.render_template(
+                '''
+                # Copyright (c).
+                # Confidential and intended for internal use only.
+
+                # base image
+                ARG BASE_CONTAINER=python:3.7
+                FROM $BASE_CONTAINER
+
+                # ENV AWS_PROFILE=ambiente-dev
+
+                LABEL maintainer="{author} <{email}>"
+
+                # Copy project files
+                # COPY ./ /./
+                COPY . /
+
+                # streamlit-specific commands
+                RUN mkdir -p /root/.streamlit
+                RUN bash -c 'echo -e "\\
+                [general]\\n\\
+                email = \\"\\"\\n\\
+                " > /root/.streamlit/credentials.toml'
+                RUN bash -c 'echo -e "\\
+                [server]\\n\\
+                enableCORS = false\\n\\
+                " > /root/.streamlit/config.toml'
+
+                # exposing default port for streamlit
+                EXPOSE 8501
+
+                # copy over and install packages
+                # RUN pip install -r ./requirements.txt
+                RUN pip install -e .[dashboard]
+
+                # run app
+                CMD streamlit run ./dashboard/app.py # -- --profile $AWS_PROFILE --server.headless false
+                '''
+                )
+
+        docker_compose = self.render_template(
+            '''
+            version: '3'
+
+            services:
+              dashboard:
+                build:
+                  context: .
+                  dockerfile: ./docker/dashboard/Dockerfile
+                image:
+                ports:
+                 - "80:8501"
+                volumes:
+                 - C:/Users/a00018578/.aws:/root/.aws
+                 - ./dashboard:/src
+            '''
+            )
+
+        dockerignore = [
+            self.render_template(
+                '''
+                **/.git
+                **/.vscode
+                **/__pycache__
+                **/docs
+                **/{project_name}.egg-info
+                **/{project_env}
+                **/notebooks
+                '''
+                )
+            ]
+        if optimized:
+            # keep the build context small: data and test output never reach the image
+            dockerignore.append(self.render_template(
+                '''
+                **/*.py[cod]
+                **/data
+                **/tests
+                **/.pytest_cache
+                **/pytest-report.html
+                **/cdk-app
+                **/site
+                '''
+                ))
+        dockerignore = b'\n'.join(dockerignore)
+
+        dirs = ['docker', 'docker/dashboard']
+
+        files = {
+            'docker/dashboard/Dockerfile': dockerfile,
+            'docker-compose.yml': docker_compose,
+            '.dockerignore': dockerignore
+            }
+
+        return dirs, files
+
+    @component('docs', help='MkDocs documentation with Material theme and mkdocstrings.')
+    def render_docs(self):
+
+        mkdocs_config = self.render_template(
+            '''
+            site_name: {project_name_str}
+            site_url: http://localhost/
+
+            nav:
+              - Home: index.md
+
+            theme:
+              name: "material"
+              palette:
+                scheme: slate
+                primary: orange
+                accent: amber
+              features:
+                - tabs
+
+            markdown_extensions:
+                - toc:
+                    permalink: True
+
+            plugins:
+              - search
+              - mkdocstrings
+
+            extra_css:
+              - css/mkdocstrings.css
+            '''
+            )
+
+        mkdocs_css = self.render_template(
+            '''
+            div.doc-contents:not(.first) {{
+            padding-left: 25px;
+            border-left: 4px solid rgba(150, 150, 150);
+            margin-bottom: 80px;
+            }}
+
+            h5.doc-heading {{
+            text-transform: none !important;
+            }}
+
+            h6.hidden-toc {{
+            margin: 0 !important;
+            position: relative;
+            top: -70px;
+            }}
+
+            h6.hidden-toc::before {{
+            margin-top: 0 !important;
+            padding-top: 0 !important;
+            }}
+
+            h6.hidden-toc a.headerlink {{
+            display: none;
+            }}
+
+            td code {{
+            word-break: normal !important;
+            }}
+
+            td p {{
+            margin-top: 0 !important;
+            margin-bottom: 0 !important;
+            }}
+            '''
+            )
+
+        dirs = ['docs', 'docs/css']
+
+        files = {
+            'mkdocs.yml': mkdocs_config,
+            'docs/index.md': f'# Welcome to {self.project_name_str} documentation\n'.encode('utf-8'),
+            'docs/css/mkdocstrings.css': mkdocs_css
+            }
+
+        return dirs, files
+
+    @component('notebooks', help='Sample Jupyter notebook.')
+    def render_notebooks(self):
+
+        jupyter_notebook = self.render_template(
+            '''
+            {{
+            "cells": [
+            {{
+            "cell_type": "code",
+            "metadata": {{
+            }},
+            "outputs": [],
+            "source": [
+                "# sample notebook\\n"
+            ]
+            }}
+            ],
+            "metadata": {{
+            }},
+            "nbformat": 4,
+            "nbformat_minor": 2
+            }}
+            '''
+            )
+
+        dirs = ['notebooks']
+
+        files = {
+            'notebooks/{today}_notebook.ipynb': jupyter_notebook
+            }
+
+        return dirs, files
+
+    @component('cdk', help='AWS CDK app folder.')
+    def render_cdk(self):
+
+        return ['cdk-app'], {}
@@ -3,7 +3,7 @@ from setuptools import setup
 setup(
     name='FireUp',
     version='1.0',
-    py_modules=['fire_up'],
+    py_modules=['fire_up', 'fire_up_templates'],
     entry_points='''
         [console_scripts]
         fireup=fire_up:main
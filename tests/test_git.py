@@ -0,0 +1,107 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+import fire_up
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+def git(repo, *args, **kwargs):
+    return subprocess.run(['git', '-C', str(repo)] + list(args), capture_output=True, text=True, check=True, **kwargs).stdout
+
+def git_write_tree(root_dir, copy_dir):
+    # tree id of the working tree as staged by `git add .`, in a copy without the repository
+    shutil.copytree(root_dir, copy_dir, ignore=shutil.ignore_patterns('.git'))
+    git(copy_dir, 'init', '-q')
+    git(copy_dir, 'add', '.')
+    return git(copy_dir, 'write-tree').strip()
+
+def assert_valid_repository(root_dir, copy_dir):
+    git(root_dir, 'fsck', '--strict', '--full')
+    assert git(root_dir, 'status', '--porcelain') == ''
+    assert git(root_dir, 'rev-parse', 'HEAD^{tree}').strip() == git_write_tree(root_dir, copy_dir)
+
+def test_generated_repository(tmp_path):
+    pack = tmp_path / 'pack'
+    (pack / 'core' / 'assets').mkdir(parents=True)
+    (pack / 'core' / 'assets' / 'logo.bin').write_bytes(os.urandom(3 * 1024 * 1024))
+    (pack / 'core' / 'NOTICE.tmpl').write_text('{project_name} by {author}\n')
+    args = ['--name', 'demo', '--directory', str(tmp_path), '--author', 'A. Author', '--email', 'a@example.com']
+    result = CliRunner().invoke(fire_up.main, args + ['--pack', str(pack), '--git', '--no-cache'])
+    assert result.exit_code == 0, result.output
+    root_dir = tmp_path / '.fire-up-demo'
+    assert_valid_repository(root_dir, tmp_path / 'copy')
+    assert git(root_dir, 'log', '--format=%an <%ae>') == 'A. Author <a@example.com>\n'
+    # the sample notebook is excluded by the generated .gitignore, as `git add .` does
+    assert 'notebooks/' not in git(root_dir, 'ls-files')
+
+def test_static_file_size_comes_from_the_file(tmp_path):
+    source = tmp_path / 'asset.bin'
+    source.write_bytes(b'actual content\n')
+    # size and hash as recorded by an outdated pack index
+    files = {'asset.bin': fire_up.StaticFile(str(source), 3, '0' * 64), 'README.md': b'# demo\n'}
+    tree = fire_up.RenderedTree(root='project', dirs=(), files=files, templates={path: path for path in files})
+    root_dir = fire_up.DirectorySink(str(tmp_path)).write(tree)
+    fire_up.init_git(root_dir, tree, 'A. Author', 'a@example.com')
+    assert_valid_repository(root_dir, tmp_path / 'copy')
+
+def test_existing_repository_is_kept(tmp_path):
+    tree = fire_up.RenderedTree(root='project', dirs=(), files={'a.txt': b'a\n'}, templates={'a.txt': 'a.txt'})
+    root_dir = fire_up.DirectorySink(str(tmp_path)).write(tree)
+    fire_up.init_git(root_dir, tree, 'A. Author', 'a@example.com')
+    with pytest.raises(FileExistsError):
+        fire_up.init_git(root_dir, tree, 'A. Author', 'a@example.com')
+
+def test_gitignore_matcher_agrees_with_git(tmp_path):
+    gitignore = '\n'.join([
+        '# comment',
+        '*.py[cod]',
+        '__pycache__/',
+        '/build/',
+        'docs/_site',
+        '.idea/**/workspace.xml',
+        'logs/**',
+        '!logs/keep.log',
+        '*.ipynb*',
+        'data/*',
+        '!data/.gitkeep',
+        'lib/',
+        '[Tt]emp-?.txt',
+        '\\#notes',
+        'trailing   ',
+        ])
+    paths = [
+        'a.pyc', 'pkg/a.pyo', 'pkg/a.pyx', 'pkg/__pycache__/a.py', '__pycache__', 'build/x', 'src/build/x',
+        'docs/_site/index.html', 'src/docs/_site', '.idea/a/b/workspace.xml', '.idea/workspace.xml', '.idea/other.xml',
+        'logs/a.log', 'logs/keep.log', 'notebooks/1_notebook.ipynb', 'data/x.csv', 'data/.gitkeep', 'data/sub/x',
+        'a/lib/x.py', 'lib.py', 'temp-1.txt', 'Temp-2.txt', 'temp-12.txt', '#notes', 'trailing', 'README.md',
+        ]
+    (tmp_path / '.gitignore').write_text(gitignore)
+    git(tmp_path, 'init', '-q')
+    result = subprocess.run(
+        ['git', '-C', str(tmp_path), 'check-ignore', '--no-index', '--stdin'],
+        input='\n'.join(paths), capture_output=True, text=True
+        )
+    expected = set(result.stdout.split())
+    ignored = fire_up.gitignore_matcher(gitignore)
+    assert {path for path in paths if ignored(path)} == expected
+
+def test_staged_repository_is_written_before_the_move(tmp_path, monkeypatch):
+    args = ['--name', 'demo', '--directory', str(tmp_path / 'out'), '--author', 'A. Author', '--email', 'a@example.com']
+    staging_dir = tmp_path / 'stage'
+    staging_dir.mkdir()
+    result = CliRunner().invoke(fire_up.main, args + ['--staged', str(staging_dir), '--git', '--no-cache'])
+    assert result.exit_code == 0, result.output
+    assert_valid_repository(tmp_path / 'out' / '.fire-up-demo', tmp_path / 'copy')
+
+    # a failing commit leaves neither the project nor the staged copy behind
+    def fail(*args, **kwargs):
+        raise OSError('disk full')
+    monkeypatch.setattr(fire_up, 'init_git', fail)
+    result = CliRunner().invoke(fire_up.main, args[:1] + ['other'] + args[2:] + ['--staged', str(staging_dir), '--git', '--no-cache'])
+    assert result.exit_code != 0
+    assert not (tmp_path / 'out' / '.fire-up-other').exists()
+    assert list(staging_dir.iterdir()) == []
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import fire_up
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules `import fire_up` may load besides click: click's gettext calls import locale
+ALLOWED_MODULES = {'fire_up', 'locale', '_locale'}
+
+def imported_modules(code):
+    # modules a fresh interpreter loads while running `code`, beyond those of `import click`
+    script = (
+        'import sys, click\n'
+        'before = set(sys.modules)\n'
+        f'{code}\n'
+        'print(sorted(set(sys.modules) - before))'
+        )
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=ROOT)
+    return set(eval(result.stdout.splitlines()[-1]))
+
+def test_import_only_loads_the_command_line():
+    assert imported_modules('import fire_up') <= ALLOWED_MODULES
+
+def test_help_and_version_do_not_load_templates():
+    for args in (['--help'], ['--version'], ['batch', '--help'], ['cache', 'stats']):
+        modules = imported_modules(f'import fire_up\nfire_up.main({args!r}, standalone_mode=False)')
+        assert 'fire_up_templates' not in modules, args
+
+def test_templates_stay_importable_from_fire_up():
+    assert fire_up.FireUp.__module__ == 'fire_up_templates'
+    assert tuple(fire_up.COMPONENTS) == fire_up.COMPONENT_NAMES
+
+def test_import_time_budget():
+    assert fire_up.measure_import_time() <= fire_up.IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,34 @@
+import os
+
+from click.testing import CliRunner
+
+import fire_up
+
+def make_pack(tmp_path):
+    pack = tmp_path / 'pack'
+    (pack / 'core' / 'assets').mkdir(parents=True)
+    (pack / 'core' / 'assets' / 'logo.bin').write_bytes(b'logo\n')
+    result = CliRunner().invoke(fire_up.main, ['pack', 'index', str(pack)])
+    assert result.exit_code == 0, result.output
+    return pack
+
+def generate(tmp_path, pack, name):
+    args = ['--name', name, '--directory', str(tmp_path), '--author', 'A. Author', '--email', 'a@example.com']
+    return CliRunner().invoke(fire_up.main, args + ['--pack', str(pack), '--no-cache'])
+
+def test_touched_asset_is_hashed_again(tmp_path):
+    pack = make_pack(tmp_path)
+    # a copy, an install or a checkout of the pack changes modification times, not content
+    asset = pack / 'core' / 'assets' / 'logo.bin'
+    os.utime(asset, ns=(0, 0))
+    result = generate(tmp_path, pack, 'demo')
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / '.fire-up-demo' / 'assets' / 'logo.bin').read_bytes() == b'logo\n'
+
+def test_changed_asset_is_refused(tmp_path):
+    pack = make_pack(tmp_path)
+    # same size, different content
+    (pack / 'core' / 'assets' / 'logo.bin').write_bytes(b'LOGO\n')
+    result = generate(tmp_path, pack, 'demo')
+    assert result.exit_code != 0
+    assert 'changed since the pack was indexed' in result.output
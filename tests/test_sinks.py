@@ -0,0 +1,78 @@
+import errno
+import os
+
+import pytest
+
+import fire_up
+
+def make_tree(files, root='project'):
+    return fire_up.RenderedTree(root=root, dirs=(), files=files, templates={path: path for path in files})
+
+def generate_linked(tmp_path, name):
+    store = fire_up.BlobStore(str(tmp_path / 'blobs'))
+    sink = fire_up.LinkedDirectorySink(str(tmp_path), store, mode='hardlink')
+    fire_up.FireUp(
+        target_dir=str(tmp_path), project_name=name, author='A. Author', email='a@example.com', sink=sink, cache=None
+        )
+    return tmp_path / f'.fire-up-{name}', sink.report
+
+def test_only_static_files_are_linked(tmp_path):
+    first, _ = generate_linked(tmp_path, 'first')
+    second, report = generate_linked(tmp_path, 'second')
+    linked = {
+        path.relative_to(second).as_posix() for path in second.rglob('*') if path.is_file() and path.stat().st_nlink > 1
+        }
+    assert linked == {
+        'docs/css/mkdocstrings.css', 'tests/test_pytest.py', 'tests/test_loguru.py',
+        'second/core/__init__.py', 'second/utils/__init__.py', 'dashboard/components/__init__.py',
+        }
+    assert report['hardlink'] == len(linked)
+    # files users edit are regular files of each project
+    (first / '.env').write_text('LOG_LEVEL=DEBUG\n')
+    (first / 'config' / 'config.yaml').write_text('edited: true\n')
+    assert (second / '.env').read_text() != 'LOG_LEVEL=DEBUG\n'
+    assert (second / 'config' / 'config.yaml').read_text() != 'edited: true\n'
+
+@pytest.mark.parametrize('sink_class', [fire_up.DirectorySink, fire_up.ConcurrentDirectorySink])
+def test_writing_over_linked_files_replaces_them(tmp_path, sink_class):
+    store = fire_up.BlobStore(str(tmp_path / 'blobs'))
+    for target in ('first', 'second'):
+        sink = fire_up.LinkedDirectorySink(str(tmp_path / target), store, mode='hardlink')
+        sink.write(make_tree({'shared.txt': b'shared\n'}), shared={'shared.txt'})
+    assert (tmp_path / 'second' / 'project' / 'shared.txt').stat().st_nlink == 3
+    sink_class(str(tmp_path / 'first')).write(make_tree({'shared.txt': b'changed\n'}))
+    assert (tmp_path / 'first' / 'project' / 'shared.txt').read_bytes() == b'changed\n'
+    assert (tmp_path / 'second' / 'project' / 'shared.txt').read_bytes() == b'shared\n'
+    assert open(store.put(b'shared\n'), 'rb').read() == b'shared\n'
+
+def test_staged_project_is_moved_across_filesystems(tmp_path, monkeypatch):
+    rename = os.rename
+    def cross_device_rename(source, destination):
+        # the staged project is on another filesystem, the hidden copy next to the destination is not
+        if '.partial-' not in source:
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        rename(source, destination)
+    monkeypatch.setattr(os, 'rename', cross_device_rename)
+    (tmp_path / 'stage').mkdir()
+    sink = fire_up.StagedSink(str(tmp_path / 'out'), staging_dir=str(tmp_path / 'stage'))
+    tree = fire_up.RenderedTree(root='project', dirs=('a', 'a/b'), files={'a/b/c.txt': b'c\n', 'd.txt': b'd\n'}, templates={})
+    root_dir = sink.write(tree)
+    assert open(f'{root_dir}/a/b/c.txt', 'rb').read() == b'c\n'
+    assert sorted(os.listdir(tmp_path / 'out')) == ['project']
+    assert os.listdir(tmp_path / 'stage') == []
+
+def test_failed_staged_generation_leaves_nothing(tmp_path):
+    (tmp_path / 'stage').mkdir()
+    sink = fire_up.StagedSink(str(tmp_path / 'out'), staging_dir=str(tmp_path / 'stage'))
+    # a template pack asset deleted during the run
+    missing = fire_up.StaticFile(str(tmp_path / 'missing.bin'), 1, '0' * 64)
+    with pytest.raises(FileNotFoundError):
+        sink.write(make_tree({'a.txt': b'a\n', 'missing.bin': missing}))
+    assert os.listdir(tmp_path / 'out') == []
+    assert os.listdir(tmp_path / 'stage') == []
+
+def test_staged_generation_only_creates_projects(tmp_path):
+    (tmp_path / 'out' / 'project').mkdir(parents=True)
+    sink = fire_up.StagedSink(str(tmp_path / 'out'), staging_dir=str(tmp_path))
+    with pytest.raises(FileExistsError):
+        sink.write(make_tree({'a.txt': b'a\n'}))
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import fire_up
+
+@pytest.fixture
+def project(tmp_path):
+    args = ['--name', 'demo', '--directory', str(tmp_path), '--author', 'A. Author', '--email', 'a@example.com']
+    result = CliRunner().invoke(fire_up.main, args + ['--no-cache'])
+    assert result.exit_code == 0, result.output
+    return tmp_path / '.fire-up-demo'
+
+def read_manifest(project):
+    return json.loads((project / fire_up.MANIFEST).read_text())
+
+def edit_manifest(project, edit):
+    manifest = read_manifest(project)
+    edit({entry['path']: entry for entry in manifest['files']}, manifest)
+    (project / fire_up.MANIFEST).write_text(json.dumps(manifest))
+
+def update(project, **kwargs):
+    report = fire_up.update_project(str(project), cache=None, **kwargs)
+    return {status: sorted(paths) for status, paths in report.items() if status != 'unchanged' and paths}
+
+def test_fresh_project_is_unchanged(project):
+    manifest = read_manifest(project)
+    assert update(project) == {}
+    assert read_manifest(project) == manifest
+
+def test_status_matrix(project):
+    previous = b'previous template output\n'
+    (project / 'Makefile').write_bytes(previous)
+    (project / 'README.md').write_text('edited by the user\n')
+    (project / 'mkdocs.yml').unlink()
+    (project / 'config.mk').unlink()
+    (project / 'setup.py').unlink()
+    def edit(entries, manifest):
+        # the Makefile and README.md templates changed since generation, only the README.md was edited
+        entries['Makefile']['hash'] = fire_up.content_hash(previous)
+        entries['README.md']['hash'] = '0' * 64
+        # mkdocs.yml was deleted by the user after its template changed, config.mk before
+        entries['mkdocs.yml']['hash'] = '1' * 64
+        # setup.py is new and a template was removed
+        manifest['files'].remove(entries['setup.py'])
+        manifest['files'].append({'path': 'old.cfg', 'template': 'old.cfg', 'hash': '2' * 64})
+    edit_manifest(project, edit)
+
+    assert update(project) == {
+        'updated': ['Makefile'],
+        'created': ['setup.py'],
+        'conflicts': ['README.md', 'mkdocs.yml'],
+        'stale': ['old.cfg'],
+        }
+    assert (project / 'Makefile').read_bytes() != previous
+    assert (project / 'README.md').read_text() == 'edited by the user\n'
+    assert not (project / 'mkdocs.yml').exists()
+    assert not (project / 'config.mk').exists()
+    assert (project / 'setup.py').exists()
+    # conflicts keep their previous hash, so that they are reported until resolved
+    entries = {entry['path']: entry for entry in read_manifest(project)['files']}
+    assert entries['README.md']['hash'] == '0' * 64
+    assert entries['mkdocs.yml']['hash'] == '1' * 64
+    assert 'old.cfg' not in entries
+    assert update(project) == {'conflicts': ['README.md', 'mkdocs.yml']}
+
+def test_force_overwrites_conflicts(project):
+    (project / 'README.md').write_text('edited by the user\n')
+    edit_manifest(project, lambda entries, manifest: entries['README.md'].update(hash='0' * 64))
+    assert update(project, force=True) == {'updated': ['README.md']}
+    assert (project / 'README.md').read_text() != 'edited by the user\n'
+    assert update(project) == {}
+
+def test_dry_run_writes_nothing(project):
+    (project / 'config.mk').unlink()
+    edit_manifest(project, lambda entries, manifest: manifest['files'].remove(entries['config.mk']))
+    manifest = read_manifest(project)
+    assert update(project, dry_run=True) == {'created': ['config.mk']}
+    assert not (project / 'config.mk').exists()
+    assert read_manifest(project) == manifest
+
+def test_command_exits_with_conflicts(project):
+    (project / 'README.md').write_text('edited by the user\n')
+    edit_manifest(project, lambda entries, manifest: entries['README.md'].update(hash='0' * 64))
+    result = CliRunner().invoke(fire_up.main, ['update', str(project), '--no-cache'])
+    assert result.exit_code == 1
+    assert f'[conflicts] {project}/README.md' in result.output